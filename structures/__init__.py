@@ -1,7 +1,7 @@
 from structures.annotation import (
     RLE, DensePoseAnnotation, ImageCaptioningAnnotation,
-    KeypointDetectionAnnotation, ObjectDetectionAnnotation,
-    PanopticSegmentationAnnotation, SegmentInfo, StuffSegmentationAnnotation
+    KeypointDetectionAnnotation, ObjectDetectionAnnotation, ObjectDetectionPolygonAnnotation,
+    ObjectDetectionRLEAnnotation, PanopticSegmentationAnnotation, SegmentInfo, StuffSegmentationAnnotation
 )
 from structures.category import (
     KeypointDetectionCategory, ObjectDetectionCategory, PanopticSegmentationCategory
@@ -9,3 +9,4 @@ from structures.category import (
 from structures.image import Image
 from structures.info import Info
 from structures.license import License
+from structures.table import AnnotationTable, ImageTable, SegmentInfoArray, indices_of, stack_bboxes
@@ -1,15 +1,59 @@
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Union
+import sys
 
-from structures.types import Annotation, compare_dict_structure
+from array import array
+from collections.abc import MutableSequence, Sequence
+from dataclasses import dataclass, field, fields
+from functools import partial
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Union
 
+from structures.types import (
+    Annotation, compare_dict_structure, generate_dumper,
+    generate_loader, load_dicts, release_to_pool
+)
 
-@dataclass
+
+_MASK_VALUES = (b'\x00', b'\x01')
+
+_load_float_array = partial(array, 'd')
+
+
+def _dump_array(values: Union[array, List[float]]) -> List[float]:
+    # dataclasses constructed by hand may hold plain lists instead of typed arrays.
+    return values.tolist() if type(values) is array else values
+
+
+def _decode_counts(counts: str) -> List[int]:
+    """Decodes `counts` of compressed Run Length Encoding, stored by COCO as a string."""
+    decoded: List[int] = []
+    position = 0
+    while position < len(counts):
+        value, shift, more = 0, 0, True
+        while more:
+            char = ord(counts[position]) - 48
+            value |= (char & 0x1f) << shift
+            more = bool(char & 0x20)
+            position += 1
+            shift += 5
+            if not more and char & 0x10:
+                value |= -1 << shift
+
+        if len(decoded) > 2:
+            value += decoded[-2]
+        decoded.append(value)
+
+    return decoded
+
+
+@dataclass(slots=True)
 class RLE:
     """Dataclass for Run Length Encoding."""
     counts: List[float] = field(default_factory=list)
     size: List[float] = field(default_factory=list)
 
+    _load: ClassVar[Callable[[Dict[str, Any]], 'RLE']]
+    to_dict: ClassVar[Callable[['RLE'], Dict[str, Any]]]
+    _pool: ClassVar[List['RLE']] = []
+
     @classmethod
     def from_dict(cls, rle_dict: Dict[str, List[float]], ignore_index = True):
         """Generates Run Length Encoding dataclass from dictionary.
@@ -22,10 +66,36 @@ class RLE:
             Run Length Encoding: Object generated from dictionary.
         """
         compare_dict_structure(rle_dict, cls, ignore_index)
-        return cls(**rle_dict)
+        return cls._load(rle_dict)
+
+    def to_mask(self) -> bytes:
+        """Decodes Run Length Encoding into the binary mask. Supports both plain and compressed `counts`.
+        Mask is flattened in column-major order as in COCO, e.g. with numpy it can be restored by
+        `np.frombuffer(mask, np.uint8).reshape(width, height).T`.
+
+        Returns:
+            bytes: Flattened mask of `height * width` values, where 1 marks pixels of the object.
+        """
+        counts = _decode_counts(self.counts) if type(self.counts) is str else self.counts
+        return b''.join(_MASK_VALUES[index & 1] * int(count) for index, count in enumerate(counts))
+
+    @classmethod
+    def release(cls, rles: Iterable['RLE']):
+        """Returns Run Length Encodings that are no longer used to the free-list,
+        so the next loaded ones reuse them instead of allocating new objects.
+        Useful for workflows that repeatedly load and discard annotations, long-lived datasets do not need it.
+
+        Args:
+            rles (Iterable[RLE]): Run Length Encodings that are not referenced anywhere else.
+        """
+        release_to_pool(cls._pool, rles)
 
 
-@dataclass
+RLE._load = staticmethod(generate_loader(RLE, RLE._pool))
+RLE.to_dict = generate_dumper(RLE)
+
+
+@dataclass(slots=True)
 class SegmentInfo:
     """Dataclass for Segment Info for the Panoptic Segmentation Annotation."""
     id: int
@@ -34,6 +104,10 @@ class SegmentInfo:
     bbox: List[int] = field(default_factory=list)
     iscrowd: int = 0
 
+    _load: ClassVar[Callable[[Dict[str, Any]], 'SegmentInfo']]
+    to_dict: ClassVar[Callable[['SegmentInfo'], Dict[str, Any]]]
+    _pool: ClassVar[List['SegmentInfo']] = []
+
     @classmethod
     def from_dict(cls, segment_info_dict: Dict[str, Any], ignore_index = True):
         """Generates Segment Info for the Panoptic Segmentation Annotation dataclass from dictionary.
@@ -46,22 +120,147 @@ class SegmentInfo:
             Segment Info: Object generated from dictionary.
         """
         compare_dict_structure(segment_info_dict, cls, ignore_index)
-        return cls(**segment_info_dict)
+        return cls._load(segment_info_dict)
+
+    @classmethod
+    def from_dicts(cls, segment_info_dicts: List[Dict[str, Any]], ignore_index = True):
+        """Generates Segment Info dataclasses from list of dictionaries in one pass.
+        Dictionaries are expected to share the same structure, so only the first one is fully validated.
+
+        Args:
+            segment_info_dicts (List[Dict[str, Any]]): Dictionary objects that have COCO Segment Info structure.
+            ignore_extra_keys (bool, optional): Ignore the fact dictionary has more fields than specified in dataset. Defaults to True.
+
+        Returns:
+            List[Segment Info]: Objects generated from dictionaries.
+        """
+        return load_dicts(segment_info_dicts, cls, ignore_index)
+
+    @classmethod
+    def release(cls, segments_info: Iterable['SegmentInfo']):
+        """Returns Segment Infos that are no longer used to the free-list,
+        so the next loaded ones reuse them instead of allocating new objects.
+        Useful for workflows that repeatedly load and discard annotations, long-lived datasets do not need it.
+
+        Args:
+            segments_info (Iterable[SegmentInfo]): Segment Infos that are not referenced anywhere else.
+        """
+        release_to_pool(cls._pool, segments_info)
+
+
+SegmentInfo._load = staticmethod(generate_loader(SegmentInfo, SegmentInfo._pool))
+SegmentInfo.to_dict = generate_dumper(SegmentInfo)
+
+
+def _load_segmentation(segmentation: Union[List[List[float]], Dict[str, Any]]) -> Union[List[List[float]], RLE]:
+    return RLE._load(segmentation) if type(segmentation) is dict else segmentation
 
 
-@dataclass
+def _load_rles(rle_dicts: List[Dict[str, Any]]) -> List[RLE]:
+    return [RLE._load(rle_dict) for rle_dict in rle_dicts]
+
+
+def _dump_rle(rle: RLE) -> Dict[str, Any]:
+    return rle.to_dict()
+
+
+def _dump_rles(rles: List[RLE]) -> List[Dict[str, Any]]:
+    return [rle.to_dict() for rle in rles]
+
+
+def _dump_segmentation(segmentation: Union[List[List[float]], RLE]) -> Union[List[List[float]], Dict[str, Any]]:
+    return segmentation.to_dict() if type(segmentation) is RLE else segmentation
+
+
+def _dump_segments_info(segments_info: Sequence[SegmentInfo]) -> List[Dict[str, Any]]:
+    return [segment_info.to_dict() for segment_info in segments_info]
+
+
+class LazySegmentInfoList(MutableSequence):
+    """List of Segment Infos that keeps raw dictionaries and generates `SegmentInfo` object only on the first access to it.
+    On the first modification every Segment Info is generated and raw dictionaries are dropped,
+    after that it behaves as a plain list.
+    """
+    __slots__ = ('_raw', '_cache')
+
+    def __init__(self, segment_info_dicts: List[Dict[str, Any]]):
+        self._raw: Optional[List[Dict[str, Any]]] = segment_info_dicts
+        self._cache: List[Union[SegmentInfo, None]] = [None] * len(segment_info_dicts)
+
+    def _materialize(self) -> List[SegmentInfo]:
+        if self._raw is not None:
+            self._cache = [self[index] for index in range(len(self._cache))]
+            self._raw = None
+        return self._cache
+
+    def __getitem__(self, index):
+        if self._raw is None:
+            return self._cache[index]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+        segment_info = self._cache[index]
+        if segment_info is None:
+            segment_info = self._cache[index] = SegmentInfo._load(self._raw[index])
+        return segment_info
+
+    def __setitem__(self, index, value):
+        self._materialize()[index] = value
+
+    def __delitem__(self, index):
+        del self._materialize()[index]
+
+    def insert(self, index: int, value: SegmentInfo):
+        self._materialize().insert(index, value)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def category_ids(self) -> List[int]:
+        """Category ids of the segments, read from raw dictionaries of segments that were not accessed yet."""
+        if self._raw is None:
+            return [segment_info.category_id for segment_info in self._cache]
+        return [
+            segment_info_dict['category_id'] if segment_info is None else segment_info.category_id
+            for segment_info, segment_info_dict in zip(self._cache, self._raw)
+        ]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (LazySegmentInfoList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+_SEGMENT_INFO_KEYS = frozenset(segment_info_field.name for segment_info_field in fields(SegmentInfo))
+
+
+def _load_segments_info(segment_info_dicts: List[Dict[str, Any]]) -> LazySegmentInfoList:
+    # Segment Infos are generated later, so missing keys are reported at load instead of on the first access.
+    for segment_info_dict in segment_info_dicts:
+        if not segment_info_dict.keys() >= _SEGMENT_INFO_KEYS:
+            compare_dict_structure(segment_info_dict, SegmentInfo)
+    return LazySegmentInfoList(segment_info_dicts)
+
+
+@dataclass(slots=True)
 class ObjectDetectionAnnotation:
     """Dataclass that mimics Object Detection Annotation structure of COCO dataset.
     Follows `Annotation`, `Indexed` and `Categorized` custom Protocols.
+    Bounding box is stored in typed float array, use `bbox.tolist()` to compare it with plain list.
     """
     id: int
     image_id: int
     category_id: int
     segmentation: Union[List[List[float]], RLE]
     area: float = 0
-    bbox: List[float] = field(default_factory=list)
+    bbox: array = field(default_factory=partial(array, 'd'))
     iscrowd: int = 0
 
+    _load: ClassVar[Callable[[Dict[str, Any]], 'ObjectDetectionAnnotation']]
+    to_dict: ClassVar[Callable[['ObjectDetectionAnnotation'], Dict[str, Any]]]
+
     @classmethod
     def from_dict(cls, annotation_dict: Dict[str, Any], ignore_index = True):
         """Generates Object Detection Annotation dataclass from dictionary.
@@ -74,22 +273,66 @@ class ObjectDetectionAnnotation:
             Object Detection Annotation: Object generated from dictionary.
         """
         compare_dict_structure(annotation_dict, cls, ignore_index)
-        return cls(
-            id = annotation_dict['id'],
-            image_id = annotation_dict['image_id'],
-            category_id = annotation_dict['category_id'],
-            segmentation = (
-                annotation_dict['segmentation']
-                if not isinstance(annotation_dict['segmentation'], dict)
-                else RLE.from_dict(annotation_dict['segmentation'], ignore_index)
-            ),
-            area = annotation_dict['area'],
-            bbox = annotation_dict['bbox'],
-            iscrowd = annotation_dict['iscrowd'],
-        )
-
-
-@dataclass
+        segmentation = annotation_dict['segmentation']
+        if type(segmentation) is dict:
+            compare_dict_structure(segmentation, RLE, ignore_index)
+        return cls._load(annotation_dict)
+
+    @classmethod
+    def from_dicts(cls, annotation_dicts: List[Dict[str, Any]], ignore_index = True):
+        """Generates Object Detection Annotation dataclasses from list of dictionaries in one pass.
+        Dictionaries are expected to share the same structure, as entries of COCO annotations list do,
+        so only the first one is fully validated.
+
+        Args:
+            annotation_dicts (List[Dict[str, Any]]): Dictionary objects that have COCO Object Detection Annotation structure.
+            ignore_extra_keys (bool, optional): Ignore the fact dictionary has more fields than specified in dataset. Defaults to True.
+
+        Returns:
+            List[Object Detection Annotation]: Objects generated from dictionaries.
+        """
+        return load_dicts(annotation_dicts, cls, ignore_index)
+
+
+ObjectDetectionAnnotation._load = staticmethod(generate_loader(
+    ObjectDetectionAnnotation, segmentation=_load_segmentation, bbox=_load_float_array
+))
+ObjectDetectionAnnotation.to_dict = generate_dumper(ObjectDetectionAnnotation, segmentation=_dump_segmentation, bbox=_dump_array)
+
+
+@dataclass(slots=True)
+class ObjectDetectionPolygonAnnotation(ObjectDetectionAnnotation):
+    """Object Detection Annotation which segmentation is always a list of polygons.
+    Follows `Annotation`, `Indexed` and `Categorized` custom Protocols.
+    """
+    segmentation: List[List[float]]
+
+
+ObjectDetectionPolygonAnnotation._load = staticmethod(generate_loader(ObjectDetectionPolygonAnnotation, bbox=_load_float_array))
+ObjectDetectionPolygonAnnotation.to_dict = generate_dumper(ObjectDetectionPolygonAnnotation, bbox=_dump_array)
+
+
+@dataclass(slots=True)
+class ObjectDetectionRLEAnnotation(ObjectDetectionAnnotation):
+    """Object Detection Annotation which segmentation is always a Run Length Encoding.
+    Follows `Annotation`, `Indexed` and `Categorized` custom Protocols.
+    """
+    segmentation: RLE
+
+
+ObjectDetectionRLEAnnotation._load = staticmethod(generate_loader(
+    ObjectDetectionRLEAnnotation, segmentation=RLE, bbox=_load_float_array
+))
+ObjectDetectionRLEAnnotation.to_dict = generate_dumper(ObjectDetectionRLEAnnotation, segmentation=_dump_rle, bbox=_dump_array)
+
+
+def _load_object_detection(annotation_dict: Dict[str, Any]) -> ObjectDetectionAnnotation:
+    if type(annotation_dict['segmentation']) is dict:
+        return ObjectDetectionRLEAnnotation._load(annotation_dict)
+    return ObjectDetectionPolygonAnnotation._load(annotation_dict)
+
+
+@dataclass(slots=True)
 class KeypointDetectionAnnotation(ObjectDetectionAnnotation):
     """Dataclass that mimics Keypoint Detection Annotation structure of COCO dataset.
     Follows `Annotation`, `Indexed` and `Categorized` custom Protocols.
@@ -97,6 +340,9 @@ class KeypointDetectionAnnotation(ObjectDetectionAnnotation):
     keypoints: List[int] = field(default_factory=list)
     num_keypoints: int = 0
 
+    _load: ClassVar[Callable[[Dict[str, Any]], 'KeypointDetectionAnnotation']]
+    to_dict: ClassVar[Callable[['KeypointDetectionAnnotation'], Dict[str, Any]]]
+
     @classmethod
     def from_dict(cls, annotation_dict: Dict[str, Any], ignore_index = True):
         """Generates Keypoint Detection Annotation dataclass from dictionary.
@@ -109,38 +355,43 @@ class KeypointDetectionAnnotation(ObjectDetectionAnnotation):
             Keypoint Detection Annotation: Object generated from dictionary.
         """
         compare_dict_structure(annotation_dict, cls, ignore_index)
-        return cls(
-            id = annotation_dict['id'],
-            image_id = annotation_dict['image_id'],
-            category_id = annotation_dict['category_id'],
-            keypoints = annotation_dict['keypoints'],
-            num_keypoints = annotation_dict['num_keypoints'],
-            segmentation = (
-                annotation_dict['segmentation']
-                if not isinstance(annotation_dict['segmentation'], dict)
-                else RLE.from_dict(annotation_dict['segmentation'], ignore_index)
-            ),
-            area = annotation_dict['area'],
-            bbox = annotation_dict['bbox'],
-            iscrowd = annotation_dict['iscrowd'],
-        )
-
-
-@dataclass
+        segmentation = annotation_dict['segmentation']
+        if type(segmentation) is dict:
+            compare_dict_structure(segmentation, RLE, ignore_index)
+        return cls._load(annotation_dict)
+
+
+KeypointDetectionAnnotation._load = staticmethod(generate_loader(
+    KeypointDetectionAnnotation, segmentation=_load_segmentation, bbox=_load_float_array
+))
+KeypointDetectionAnnotation.to_dict = generate_dumper(KeypointDetectionAnnotation, segmentation=_dump_segmentation, bbox=_dump_array)
+
+
+@dataclass(slots=True)
 class StuffSegmentationAnnotation(ObjectDetectionAnnotation):
     """Dataclass that mimics Stuff Segmentation Annotation structure of COCO dataset.
     Follows `Annotation`, `Indexed` and `Categorized` custom Protocols.
     """
 
 
-@dataclass
+StuffSegmentationAnnotation._load = staticmethod(generate_loader(
+    StuffSegmentationAnnotation, segmentation=_load_segmentation, bbox=_load_float_array
+))
+StuffSegmentationAnnotation.to_dict = generate_dumper(StuffSegmentationAnnotation, segmentation=_dump_segmentation, bbox=_dump_array)
+
+
+@dataclass(slots=True)
 class PanopticSegmentationAnnotation:
     """Dataclass that mimics Panoptic Segmentation Annotation structure of COCO dataset.
     Follows `Annotation` custom Protocol.
+    Loaded `segments_info` is `LazySegmentInfoList`, that generates Segment Infos on the first access.
     """
     image_id: int
     file_name: str = ""
-    segments_info: List[SegmentInfo] = field(default_factory=list)
+    segments_info: MutableSequence[SegmentInfo] = field(default_factory=list)
+
+    _load: ClassVar[Callable[[Dict[str, Any]], 'PanopticSegmentationAnnotation']]
+    to_dict: ClassVar[Callable[['PanopticSegmentationAnnotation'], Dict[str, Any]]]
 
     @classmethod
     def from_dict(cls, annotation_dict: Dict[str, Any], ignore_index = True):
@@ -154,14 +405,40 @@ class PanopticSegmentationAnnotation:
             Panoptic Segmentation Annotation: Object generated from dictionary.
         """
         compare_dict_structure(annotation_dict, cls, ignore_index)
-        return cls(
-            image_id = annotation_dict['image_id'],
-            file_name = annotation_dict['file_name'],
-            segments_info = SegmentInfo.from_dict(annotation_dict['segments_info'], ignore_index),
-        )
+        for segment_info_dict in annotation_dict['segments_info']:
+            compare_dict_structure(segment_info_dict, SegmentInfo, ignore_index)
+        return cls._load(annotation_dict)
+
+    @classmethod
+    def from_dicts(cls, annotation_dicts: List[Dict[str, Any]], ignore_index = True):
+        """Generates Panoptic Segmentation Annotation dataclasses from list of dictionaries in one pass.
+        Dictionaries are expected to share the same structure, as entries of COCO annotations list do,
+        so only the first one is fully validated.
+
+        Args:
+            annotation_dicts (List[Dict[str, Any]]): Dictionary objects that have COCO Panoptic Segmentation Annotation structure.
+            ignore_extra_keys (bool, optional): Ignore the fact dictionary has more fields than specified in dataset. Defaults to True.
+
+        Returns:
+            List[Panoptic Segmentation Annotation]: Objects generated from dictionaries.
+        """
+        return load_dicts(annotation_dicts, cls, ignore_index)
+
+    @property
+    def category_ids(self) -> List[int]:
+        """Category ids of the segments, does not generate Segment Infos that were not accessed yet."""
+        if isinstance(self.segments_info, LazySegmentInfoList):
+            return self.segments_info.category_ids()
+        return [segment_info.category_id for segment_info in self.segments_info]
+
 
+PanopticSegmentationAnnotation._load = staticmethod(
+    generate_loader(PanopticSegmentationAnnotation, file_name=sys.intern, segments_info=_load_segments_info)
+)
+PanopticSegmentationAnnotation.to_dict = generate_dumper(PanopticSegmentationAnnotation, segments_info=_dump_segments_info)
 
-@dataclass
+
+@dataclass(slots=True)
 class ImageCaptioningAnnotation:
     """Dataclass that mimics Image Captioning Annotation structure of COCO dataset.
     Follows `Annotation` and `Indexed` custom Protocols.
@@ -170,6 +447,9 @@ class ImageCaptioningAnnotation:
     image_id: int
     caption: str = ""
 
+    _load: ClassVar[Callable[[Dict[str, Any]], 'ImageCaptioningAnnotation']]
+    to_dict: ClassVar[Callable[['ImageCaptioningAnnotation'], Dict[str, Any]]]
+
     @classmethod
     def from_dict(cls, annotation_dict: Dict[str, Any], ignore_index = True):
         """Generates Image Captioning Annotation dataclass from dictionary.
@@ -182,13 +462,33 @@ class ImageCaptioningAnnotation:
             Image Captioning Annotation: Object generated from dictionary.
         """
         compare_dict_structure(annotation_dict, cls, ignore_index)
-        return cls(**annotation_dict)
+        return cls._load(annotation_dict)
 
+    @classmethod
+    def from_dicts(cls, annotation_dicts: List[Dict[str, Any]], ignore_index = True):
+        """Generates Image Captioning Annotation dataclasses from list of dictionaries in one pass.
+        Dictionaries are expected to share the same structure, as entries of COCO annotations list do,
+        so only the first one is fully validated.
 
-@dataclass
+        Args:
+            annotation_dicts (List[Dict[str, Any]]): Dictionary objects that have COCO Image Captioning Annotation structure.
+            ignore_extra_keys (bool, optional): Ignore the fact dictionary has more fields than specified in dataset. Defaults to True.
+
+        Returns:
+            List[Image Captioning Annotation]: Objects generated from dictionaries.
+        """
+        return load_dicts(annotation_dicts, cls, ignore_index)
+
+
+ImageCaptioningAnnotation._load = staticmethod(generate_loader(ImageCaptioningAnnotation))
+ImageCaptioningAnnotation.to_dict = generate_dumper(ImageCaptioningAnnotation)
+
+
+@dataclass(slots=True)
 class DensePoseAnnotation:
     """Dataclass that mimics Dense Pose Annotation structure of COCO dataset.
     Follows `Annotation`, `Indexed` and `Categorized` custom Protocols.
+    Dense Pose points are stored in typed float arrays instead of lists of Python floats.
     """
     id: int
     image_id: int
@@ -196,13 +496,16 @@ class DensePoseAnnotation:
     is_crowd: int = 0
     area: int = 0
     bbox: List[int] = field(default_factory=list)
-    dp_I: List[float] = field(default_factory=list)
-    dp_U: List[float] = field(default_factory=list)
-    dp_V: List[float] = field(default_factory=list)
-    dp_x: List[float] = field(default_factory=list)
-    dp_y: List[float] = field(default_factory=list)
+    dp_I: array = field(default_factory=partial(array, 'd'))
+    dp_U: array = field(default_factory=partial(array, 'd'))
+    dp_V: array = field(default_factory=partial(array, 'd'))
+    dp_x: array = field(default_factory=partial(array, 'd'))
+    dp_y: array = field(default_factory=partial(array, 'd'))
     dp_masks: List[RLE] = field(default_factory=list)
 
+    _load: ClassVar[Callable[[Dict[str, Any]], 'DensePoseAnnotation']]
+    to_dict: ClassVar[Callable[['DensePoseAnnotation'], Dict[str, Any]]]
+
     @classmethod
     def from_dict(cls, annotation_dict: Dict[str, Any], ignore_index = True):
         """Generates Dense Pose Annotation dataclass from dictionary.
@@ -215,20 +518,36 @@ class DensePoseAnnotation:
             Dense Pose Annotation: Object generated from dictionary.
         """
         compare_dict_structure(annotation_dict, cls, ignore_index)
-        return cls(
-            id = annotation_dict['id'],
-            image_id = annotation_dict['image_id'],
-            category_id = annotation_dict['category_id'],
-            is_crowd = annotation_dict['is_crowd'],
-            area = annotation_dict['area'],
-            bbox = annotation_dict['bbox'],
-            dp_I = annotation_dict['dp_I'],
-            dp_U = annotation_dict['dp_U'],
-            dp_V = annotation_dict['dp_V'],
-            dp_x = annotation_dict['dp_x'],
-            dp_y = annotation_dict['dp_y'],
-            dp_masks = [RLE.from_dict(mask, ignore_index) for mask in annotation_dict['dp_masks']],
-        )
+        for mask in annotation_dict['dp_masks']:
+            compare_dict_structure(mask, RLE, ignore_index)
+        return cls._load(annotation_dict)
+
+    @classmethod
+    def from_dicts(cls, annotation_dicts: List[Dict[str, Any]], ignore_index = True):
+        """Generates Dense Pose Annotation dataclasses from list of dictionaries in one pass.
+        Dictionaries are expected to share the same structure, as entries of COCO annotations list do,
+        so only the first one is fully validated.
+
+        Args:
+            annotation_dicts (List[Dict[str, Any]]): Dictionary objects that have COCO Dense Pose Annotation structure.
+            ignore_extra_keys (bool, optional): Ignore the fact dictionary has more fields than specified in dataset. Defaults to True.
+
+        Returns:
+            List[Dense Pose Annotation]: Objects generated from dictionaries.
+        """
+        return load_dicts(annotation_dicts, cls, ignore_index)
+
+
+DensePoseAnnotation._load = staticmethod(generate_loader(
+    DensePoseAnnotation,
+    dp_I=_load_float_array, dp_U=_load_float_array, dp_V=_load_float_array,
+    dp_x=_load_float_array, dp_y=_load_float_array, dp_masks=_load_rles,
+))
+DensePoseAnnotation.to_dict = generate_dumper(
+    DensePoseAnnotation,
+    dp_I=_dump_array, dp_U=_dump_array, dp_V=_dump_array,
+    dp_x=_dump_array, dp_y=_dump_array, dp_masks=_dump_rles,
+)
 
 
 
@@ -240,9 +559,19 @@ DICT_TO_ANNOTATION_MAP = {
     "dense_pose" : ["id", "image_id", "category_id", "is_crowd", "area", "bbox", "dp_I", "dp_U", "dp_V", "dp_x", "dp_y", "dp_masks"],
 }
 
+_ANNOTATION_KEYS = {key: frozenset(value) for key, value in DICT_TO_ANNOTATION_MAP.items()}
+
+_ANNOTATION_DISPATCH = (
+    ('dp_I', DensePoseAnnotation.from_dict),
+    ('segments_info', PanopticSegmentationAnnotation.from_dict),
+    ('caption', ImageCaptioningAnnotation.from_dict),
+    ('keypoints', KeypointDetectionAnnotation.from_dict),
+)
+
 
 def dict_to_annotation(annotation_dict: Dict[str, Any], ignore_extra_keys = True) -> Annotation:
-    """Calls specific Category object constructor based on the structure of the `annotation_dict`.
+    """Calls specific Annotation object constructor based on the structure of the `annotation_dict`.
+    Type of the annotation is recognized by the key that is unique for it, e.g. `caption` or `dp_I`.
 
     Args:
         annotation_dict (Dict[str, Any]): One of COCO Annotation dictionaries.
@@ -254,22 +583,58 @@ def dict_to_annotation(annotation_dict: Dict[str, Any], ignore_extra_keys = True
     Returns:
         Annotation: Dataclass category generated from the `annotation_dict`.
     """
-    if set(DICT_TO_ANNOTATION_MAP['object_detection']).issubset(annotation_dict.keys()):
-        return ObjectDetectionAnnotation.from_dict(annotation_dict, ignore_extra_keys)
-
-    elif set(DICT_TO_ANNOTATION_MAP['keypoint_detection']).issubset(annotation_dict.keys()):
-        return KeypointDetectionAnnotation.from_dict(annotation_dict, ignore_extra_keys)
-
-    elif set(DICT_TO_ANNOTATION_MAP['panoptic_segmentation']).issubset(annotation_dict.keys()):
-        return PanopticSegmentationAnnotation.from_dict(annotation_dict, ignore_extra_keys)
+    for key, from_dict in _ANNOTATION_DISPATCH:
+        if key in annotation_dict:
+            return from_dict(annotation_dict, ignore_extra_keys)
 
-    elif set(DICT_TO_ANNOTATION_MAP['image_captioning']).issubset(annotation_dict.keys()):
-        return ImageCaptioningAnnotation.from_dict(annotation_dict, ignore_extra_keys)
-
-    elif set(DICT_TO_ANNOTATION_MAP['dense_pose']).issubset(annotation_dict.keys()):
-        return DensePoseAnnotation.from_dict(annotation_dict, ignore_extra_keys)
+    if _ANNOTATION_KEYS['object_detection'] <= annotation_dict.keys():
+        if type(annotation_dict['segmentation']) is dict:
+            return ObjectDetectionRLEAnnotation.from_dict(annotation_dict, ignore_extra_keys)
+        return ObjectDetectionPolygonAnnotation.from_dict(annotation_dict, ignore_extra_keys)
 
     raise ValueError(
         "Unexpected annotation structure. Consider manually creating COCO dataset."
         "\nAnd extending one of existing objects or create new following one of the Protocols structure."
     )
+
+
+def dict_to_annotations(annotation_dicts: List[Dict[str, Any]], ignore_extra_keys = True) -> List[Annotation]:
+    """Generates Annotation objects from the list of COCO Annotation dictionaries.
+    All annotations of COCO dataset usually share the same structure, so type of annotations is recognized
+    and validated only by the first dictionary, rest with the same keys are constructed by the batch loader.
+    Dictionaries with other keys, e.g. captions mixed with object detections, are recognized one by one.
+
+    Args:
+        annotation_dicts (List[Dict[str, Any]]): List of COCO Annotation dictionaries of the same type.
+        ignore_extra_keys (bool, optional): Ignore the fact dictionary has more fields than specified in dataset. Defaults to True.
+
+    Raises:
+        ValueError: If `annotation_dicts` have unspecified structure.
+
+    Returns:
+        List[Annotation]: Dataclass annotations generated from the `annotation_dicts`.
+    """
+    if not annotation_dicts:
+        return list()
+
+    first = dict_to_annotation(annotation_dicts[0], ignore_extra_keys)
+    annotation_type = type(first)
+    return load_dicts(
+        annotation_dicts, annotation_type, ignore_extra_keys,
+        annotation_loader(annotation_type), dict_to_annotation, first
+    )
+
+
+def annotation_loader(annotation_type: Any) -> Callable[[Dict[str, Any]], Annotation]:
+    """Unchecked loader for the dictionaries of the same structure as the given Annotation dataclass.
+
+    Args:
+        annotation_type (Any): Annotation dataclass recognized by `dict_to_annotation`.
+
+    Returns:
+        Callable[[Dict[str, Any]], Annotation]: Loader that constructs Annotation without validation.
+    """
+    if issubclass(annotation_type, (ObjectDetectionPolygonAnnotation, ObjectDetectionRLEAnnotation)):
+        # polygons and crowd RLEs are mixed in the same list, so each one picks its own dataclass.
+        return _load_object_detection
+    return annotation_type._load
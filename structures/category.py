@@ -1,10 +1,12 @@
+import sys
+
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Callable, ClassVar, Dict, List
 
-from structures.types import Category, compare_dict_structure
+from structures.types import Category, compare_dict_structure, generate_dumper, generate_loader
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectDetectionCategory:
     """Dataclass that mimics Object Detection Category structure of COCO dataset.
     Follows `Category` custom Protocol.
@@ -13,6 +15,9 @@ class ObjectDetectionCategory:
     name: str = ""
     supercategory: str = ""
 
+    _load: ClassVar[Callable[[Dict[str, Any]], 'ObjectDetectionCategory']]
+    to_dict: ClassVar[Callable[['ObjectDetectionCategory'], Dict[str, Any]]]
+
     @classmethod
     def from_dict(cls, category_dict: Dict[str, Any], ignore_extra_keys = True):
         """Generates Object Detection Category dataclass from dictionary.
@@ -25,10 +30,14 @@ class ObjectDetectionCategory:
             Object Detection Category: Object generated from dictionary.
         """
         compare_dict_structure(category_dict, cls, ignore_extra_keys)
-        return cls(**category_dict)
+        return cls._load(category_dict)
+
+
+ObjectDetectionCategory._load = staticmethod(generate_loader(ObjectDetectionCategory, name=sys.intern, supercategory=sys.intern))
+ObjectDetectionCategory.to_dict = generate_dumper(ObjectDetectionCategory)
 
 
-@dataclass
+@dataclass(slots=True)
 class KeypointDetectionCategory(ObjectDetectionCategory):
     """Dataclass that mimics Keypoint Detection Category structure of COCO dataset.
     Follows `Category` custom Protocol.
@@ -36,6 +45,9 @@ class KeypointDetectionCategory(ObjectDetectionCategory):
     keypoints: List[str] = field(default_factory=list)
     skeleton: List[int] = field(default_factory=list)
 
+    _load: ClassVar[Callable[[Dict[str, Any]], 'KeypointDetectionCategory']]
+    to_dict: ClassVar[Callable[['KeypointDetectionCategory'], Dict[str, Any]]]
+
     @classmethod
     def from_dict(cls, category_dict: Dict[str, Any], ignore_extra_keys = True):
         """Generates Keypoint Detection Category dataclass from dictionary.
@@ -48,10 +60,14 @@ class KeypointDetectionCategory(ObjectDetectionCategory):
             Keypoint Detection Category: Object generated from dictionary.
         """
         compare_dict_structure(category_dict, cls, ignore_extra_keys)
-        return cls(**category_dict)
+        return cls._load(category_dict)
+
 
+KeypointDetectionCategory._load = staticmethod(generate_loader(KeypointDetectionCategory, name=sys.intern, supercategory=sys.intern))
+KeypointDetectionCategory.to_dict = generate_dumper(KeypointDetectionCategory)
 
-@dataclass
+
+@dataclass(slots=True)
 class PanopticSegmentationCategory(ObjectDetectionCategory):
     """Dataclass that mimics Panoptic Segmentation Category structure of COCO dataset.
     Follows `Category` custom Protocol.
@@ -59,6 +75,9 @@ class PanopticSegmentationCategory(ObjectDetectionCategory):
     isthing: int = 0
     color: List[str] = field(default_factory=list)
 
+    _load: ClassVar[Callable[[Dict[str, Any]], 'PanopticSegmentationCategory']]
+    to_dict: ClassVar[Callable[['PanopticSegmentationCategory'], Dict[str, Any]]]
+
     @classmethod
     def from_dict(cls, category_dict: Dict[str, Any], ignore_extra_keys = True):
         """Generates Panoptic Segmentation Category dataclass from dictionary.
@@ -71,7 +90,11 @@ class PanopticSegmentationCategory(ObjectDetectionCategory):
             Panoptic Segmentation Category: Object generated from dictionary.
         """
         compare_dict_structure(category_dict, cls, ignore_extra_keys)
-        return cls(**category_dict)
+        return cls._load(category_dict)
+
+
+PanopticSegmentationCategory._load = staticmethod(generate_loader(PanopticSegmentationCategory, name=sys.intern, supercategory=sys.intern))
+PanopticSegmentationCategory.to_dict = generate_dumper(PanopticSegmentationCategory)
 
 
 
@@ -81,9 +104,17 @@ DICT_TO_CATEGORY_MAP = {
     "panoptic_segmentation" : ["id", "name", "supercategory", "isthing", "color"],
 }
 
+_CATEGORY_KEYS = {key: frozenset(value) for key, value in DICT_TO_CATEGORY_MAP.items()}
+
+_CATEGORY_DISPATCH = (
+    ('isthing', PanopticSegmentationCategory.from_dict),
+    ('keypoints', KeypointDetectionCategory.from_dict),
+)
+
 
 def dict_to_category(category_dict: Dict[str, Any], ignore_extra_keys = True) -> Category:
     """Calls specific Category object constructor based on the structure of the `category_dict`.
+    Type of the category is recognized by the key that is unique for it, e.g. `isthing` or `keypoints`.
 
     Args:
         category_dict (Dict[str, Any]): One of COCO Category dictionaries.
@@ -95,14 +126,12 @@ def dict_to_category(category_dict: Dict[str, Any], ignore_extra_keys = True) ->
     Returns:
         Category: Dataclass category generated from the `category_dict`.
     """
-    if set(DICT_TO_CATEGORY_MAP['object_detection']).issubset(category_dict.keys()):
-        return ObjectDetectionCategory.from_dict(category_dict, ignore_extra_keys)
-
-    elif set(DICT_TO_CATEGORY_MAP['keypoint_detection']).issubset(category_dict.keys()):
-        return KeypointDetectionCategory.from_dict(category_dict, ignore_extra_keys)
+    for key, from_dict in _CATEGORY_DISPATCH:
+        if key in category_dict:
+            return from_dict(category_dict, ignore_extra_keys)
 
-    elif set(DICT_TO_CATEGORY_MAP['panoptic_segmentation']).issubset(category_dict.keys()):
-        return PanopticSegmentationCategory.from_dict(category_dict, ignore_extra_keys)
+    if _CATEGORY_KEYS['object_detection'] <= category_dict.keys():
+        return ObjectDetectionCategory.from_dict(category_dict, ignore_extra_keys)
 
     raise ValueError(
         "Unexpected category structure. Consider manually creating COCO dataset."
@@ -1,24 +1,217 @@
 import json
+import mmap
+import os
 import random
 
-from copy import deepcopy
-from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Union, overload, cast
+from copy import copy, deepcopy
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Any, BinaryIO, Dict, Hashable, Iterator, List, Optional, Set, Tuple, Union, overload, cast
 
 from structures import Image, Info, License
-from structures.annotation import PanopticSegmentationAnnotation, dict_to_annotation
+from structures.annotation import (
+    PanopticSegmentationAnnotation, annotation_loader, dict_to_annotation, dict_to_annotations
+)
 from structures.category import dict_to_category
 from structures.types import (
     Annotation, Categorized, Category,
-    Indexed, compare_dict_structure, isinstances
+    Indexed, T, compare_dict_structure, isinstances_sampled, load_dicts
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _read_file(path: str) -> bytearray:
+    """Reads whole file into a buffer preallocated by the file size, without growing and copying intermediate chunks.
+    On platforms that support it, kernel is advised that the file is read sequentially to use larger read-ahead.
+    """
+    with open(path, 'rb', buffering=0) as f:
+        fd = f.fileno()
+        buffer = bytearray(os.fstat(fd).st_size)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        view = memoryview(buffer)
+        read = 0
+        while read < len(buffer):
+            size = f.readinto(view[read:])
+            if not size:
+                del buffer[read:]
+                break
+            read += size
+
+        tail = f.read()
+        if tail:
+            buffer += tail
+    return buffer
+
+
+def _load_json(path: str) -> Any:
+    """Parses JSON file. With `orjson` the file is memory mapped and parsed straight from the page cache without copying,
+    otherwise it is read into a preallocated buffer and parsed with `json`.
+    """
+    if orjson is None:
+        return json.loads(_read_file(path))
+
+    with open(path, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            return orjson.loads(b'')
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def _stream_json_items(json_file: BinaryIO, prefixes: Tuple[str, ...]) -> Iterator[Tuple[str, Any]]:
+    """Yields `(prefix, item)` for every JSON object found under one of the `prefixes` as soon as it is parsed.
+    Keys of the top level object are yielded with the empty prefix.
+    """
+    builder, item_prefix = None, None
+    for prefix, event, value in ijson.parse(json_file, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if event == 'end_map' and prefix == item_prefix:
+                yield item_prefix, builder.value
+                builder = None
+
+        elif event == 'start_map' and prefix in prefixes:
+            builder, item_prefix = ijson.ObjectBuilder(), prefix
+            builder.event(event, value)
+
+        elif event == 'map_key' and prefix == '':
+            yield prefix, value
+
+
+def _build_index(items: List[T], attribute: str) -> Dict[Hashable, T]:
+    """Maps value of the `attribute` to the item, first item wins as the linear search would return it."""
+    index: Dict[Hashable, T] = dict()
+    for item in items:
+        index.setdefault(getattr(item, attribute), item)
+    return index
+
+
+def _discard_from_index(index: Dict[Hashable, T], items: List[T], attribute: str, item: T):
+    """Removes `item` from the index, next item with the same value of the `attribute` takes its place."""
+    key = getattr(item, attribute)
+    if index.get(key) is not item:
+        return
+
+    del index[key]
+    replacement = next((other for other in items if getattr(other, attribute, None) == key), None)
+    if replacement is not None:
+        index[key] = replacement
+
+
+def _filter_instances(items: List[Any], class_or_tuple: Any) -> List[Any]:
+    """Items that are instances of the class or protocol, which is checked only once per concrete class of the items."""
+    samples = {type(item): item for item in items}
+    matched_types = {item_type for item_type, sample in samples.items() if isinstance(sample, class_or_tuple)}
+    return [item for item in items if type(item) in matched_types]
+
+
+def _find_indexed(items: List[T], index: Dict[Hashable, T]) -> Dict[int, T]:
+    """Finds objects of the index that are the same or equal to the `items`, keyed by their identity."""
+    found: Dict[int, T] = dict()
+    for item in items:
+        indexed = index.get(getattr(item, 'id', None))
+        if indexed is not None and (indexed is item or indexed == item):
+            found[id(indexed)] = indexed
+    return found
+
+
+def _remove_by_identity(items: List[T], removed: Dict[int, T]) -> List[T]:
+    """Filters out `removed` items, keyed by their identity, in a single pass over the list."""
+    return [item for item in items if id(item) not in removed]
+
+
+def _add_to_group(groups: Dict[Hashable, List[T]], key: Hashable, item: T):
+    """Appends `item` to the group of items that share the same `key`."""
+    group = groups.get(key)
+    if group is None:
+        groups[key] = [item]
+    else:
+        group.append(item)
+
+
+def _discard_from_group(groups: Dict[Hashable, List[T]], key: Hashable, item: T):
+    """Removes exactly the `item` object from the group of the `key`, empty groups are dropped."""
+    group = groups.get(key)
+    if group is None:
+        return
+
+    for position, other in enumerate(group):
+        if other is item:
+            del group[position]
+            break
+
+    if not group:
+        del groups[key]
+
+
+def _move_group(groups: Dict[Hashable, List[T]], old_key: Hashable, new_key: Hashable):
+    """Moves all items of the `old_key` group to the `new_key` group."""
+    group = groups.pop(old_key, None)
+    if group is not None:
+        groups.setdefault(new_key, []).extend(group)
+
+
+def _move_in_index(index: Dict[Hashable, T], old_key: Hashable, new_key: Hashable, item: T):
+    """Moves `item` from the `old_key` to the `new_key` if it is indexed."""
+    if index.get(old_key) is item:
+        del index[old_key]
+        index[new_key] = item
+
+
+def _copy_item(item: T) -> T:
+    """Shallow copy of the dataset item, so its ids can be changed without affecting the original one.
+    Segment Infos of Panoptic Segmentation Annotations are copied as well, as reindexing changes their category ids.
+    """
+    item = copy(item)
+    if isinstance(item, PanopticSegmentationAnnotation):
+        item.segments_info = [copy(segment_info) for segment_info in item.segments_info]
+    return item
+
+
+def _validate_new_items(items: List[Any], item_type: Any, index: Dict[int, Any], kind: str) -> Set[int]:
+    """Checks in one pass that every item is of the `item_type` and its id is not used in the `index` or by other items.
+    Returns set of ids of the validated items.
+    """
+    valid_types: Set[type] = set()
+    new_ids: Set[int] = set()
+    for item in items:
+        if type(item) not in valid_types:
+            if not isinstance(item, item_type):
+                raise TypeError('Input argument of unexpected type.')
+            valid_types.add(type(item))
+
+        if item.id in index or item.id in new_ids:
+            raise ValueError(
+                f"{kind.capitalize()} with ID {item.id} already exists."
+                f"Consider using get_new_{kind}_id() function when assigning ID to the object."
+            )
+        new_ids.add(item.id)
+
+    return new_ids
+
 
-@dataclass
+@dataclass(slots=True)
 class COCO:
     """Dataclass that follows one of the COCO dataset structures.
     Has number of properties to easy work with COCO dataset.
     Such as appending new items, removing existing, reindexing, splitting or combining datasets, etc.
+
+    Items are looked up by `get_*` methods through indexes built when dataset is created.
+    Lists of items and their ids should be modified through `append_*`, `extend_*`, `remove_*` and `reindex_*` methods,
+    which keep indexes up to date. If lists are modified directly, e.g. `coco.annotations.append(annotation)`,
+    or ids of items are changed, e.g. `coco.images[0].id = 77`, `rebuild_indexes` should be called afterwards,
+    otherwise `get_*` methods silently miss the changes.
     """
     info: Info
     licenses: List[License] = field(default_factory=list)
@@ -26,6 +219,19 @@ class COCO:
     images: List[Image] = field(default_factory=list)
     annotations: List[Annotation] = field(default_factory=list)
 
+    # lookup indexes and id counters, populated by `rebuild_indexes` in `__post_init__`.
+    _next_ids: Dict[str, int] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _license_by_id: Dict[int, License] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _license_by_name: Dict[str, License] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _category_by_id: Dict[int, Category] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _category_by_name: Dict[str, Category] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _categories_by_supercategory: Dict[str, List[Category]] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _image_by_id: Dict[int, Image] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _image_by_file_name: Dict[str, Image] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _annotation_by_id: Dict[int, Annotation] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _annotations_by_image_id: Dict[int, List[Annotation]] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _annotations_by_category_id: Dict[int, List[Annotation]] = field(init=False, repr=False, compare=False, default_factory=dict)
+
 
     @classmethod
     def from_dict(cls, coco_dict: Dict[str, Any], ignore_extra_keys = True):
@@ -41,9 +247,9 @@ class COCO:
         compare_dict_structure(coco_dict, cls)
         return cls(
             info = Info.from_dict(coco_dict['info'], ignore_extra_keys),
-            licenses = [License.from_dict(license, ignore_extra_keys) for license in coco_dict['licenses']],
-            images = [Image.from_dict(image, ignore_extra_keys) for image in coco_dict['images']],
-            annotations = [dict_to_annotation(annotation) for annotation in coco_dict['annotations']],
+            licenses = load_dicts(coco_dict['licenses'], License, ignore_extra_keys),
+            images = load_dicts(coco_dict['images'], Image, ignore_extra_keys),
+            annotations = dict_to_annotations(coco_dict['annotations'], ignore_extra_keys),
             categories = (
                 [dict_to_category(category, ignore_extra_keys) for category in coco_dict['categories']]
                 if 'categories' in coco_dict.keys() 
@@ -53,28 +259,115 @@ class COCO:
 
     @classmethod
     def from_json(cls, path_to_json: str, ignore_extra_keys = True):
-        """Generates COCO datset dataclass from json file.
+        """Generates COCO datset dataclass from json file. Uses `orjson` for parsing if it is installed,
+        in which case file is memory mapped instead of being read into a separate buffer.
+
+        Args:
+            path_to_json (str): path where COCO JSON dataset is located.
+            ignore_extra_keys (bool, optional): Ignore the fact dictionary has more fields than specified in dataset. Defaults to True.
+
+        Returns:
+            COCO: COCO dataset generated from JSON file.
+        """
+        return COCO.from_dict(_load_json(path_to_json), ignore_extra_keys)
+
+    @classmethod
+    def from_json_streaming(cls, path_to_json: str, ignore_extra_keys = True):
+        """Generates COCO datset dataclass from json file, that is parsed incrementally with `ijson`.
+        Every item is converted to the dataclass as soon as it is parsed, so raw dictionaries of entire dataset
+        are never kept in memory at once. Requires `ijson` to be installed.
 
         Args:
             path_to_json (str): path where COCO JSON dataset is located.
             ignore_extra_keys (bool, optional): Ignore the fact dictionary has more fields than specified in dataset. Defaults to True.
 
+        Raises:
+            ImportError: If `ijson` is not installed.
+
         Returns:
             COCO: COCO dataset generated from JSON file.
         """
-        with open(path_to_json) as f:
-            data = json.load(f)
-        return COCO.from_dict(data, ignore_extra_keys)
+        if ijson is None:
+            raise ImportError('Streaming of COCO dataset requires `ijson` to be installed.')
+
+        keys: List[str] = list()
+        info_dict: Dict[str, Any] = dict()
+        licenses: List[License] = list()
+        images: List[Image] = list()
+        categories: List[Category] = list()
+        annotations: List[Annotation] = list()
+        annotation_keys, annotation_type, load = None, None, None
+
+        prefixes = ('info', 'licenses.item', 'images.item', 'categories.item', 'annotations.item')
+        with open(path_to_json, 'rb') as f:
+            for prefix, item in _stream_json_items(f, prefixes):
+                if prefix == 'annotations.item':
+                    if load is None:
+                        annotation = dict_to_annotation(item, ignore_extra_keys)
+                        annotation_keys, annotation_type = item.keys(), type(annotation)
+                        load = annotation_loader(annotation_type)
+                        annotations.append(annotation)
+                        continue
+
+                    # same as `load_dicts`, only items with the keys of the first one are loaded unchecked.
+                    if item.keys() != annotation_keys:
+                        annotations.append(dict_to_annotation(item, ignore_extra_keys))
+                        continue
+                    try:
+                        annotations.append(load(item))
+                    except (KeyError, TypeError):
+                        annotation_type.from_dict(item, ignore_extra_keys)
+                        raise
+
+                elif prefix == 'images.item':
+                    images.append(Image.from_dict(item, ignore_extra_keys))
+
+                elif prefix == 'categories.item':
+                    categories.append(dict_to_category(item, ignore_extra_keys))
+
+                elif prefix == 'licenses.item':
+                    licenses.append(License.from_dict(item, ignore_extra_keys))
+
+                elif prefix == 'info':
+                    info_dict = item
+
+                else:
+                    keys.append(item)
+
+        compare_dict_structure(dict.fromkeys(keys), cls)
+        return cls(
+            info = Info.from_dict(info_dict, ignore_extra_keys),
+            licenses = licenses,
+            images = images,
+            annotations = annotations,
+            categories = categories if 'categories' in keys else None,
+        )
 
 
-    def to_dict(self):
-        """Transforms COCO dataclass to the Dictionary."""
-        return {key: value for key, value in asdict(self) if value is not None}
+    def to_dict(self) -> Dict[str, Any]:
+        """Transforms COCO dataclass to the Dictionary.
+        Nested values are not copied, typed arrays are converted to lists, so the result can be passed to `json.dumps`.
+        """
+        coco_dict: Dict[str, Any] = {
+            'info': self.info.to_dict(),
+            'licenses': [license.to_dict() for license in self.licenses],
+        }
+        if self.categories is not None:
+            coco_dict['categories'] = [category.to_dict() for category in self.categories]
+        coco_dict['images'] = [image.to_dict() for image in self.images]
+        coco_dict['annotations'] = [annotation.to_dict() for annotation in self.annotations]
+        return coco_dict
 
     def to_json(self, path: str):
-        """Saves current state of COCO dataset into json file, where `path` is absolute path with filename."""
-        with open(path, 'w') as json_file:
-            json.dump(self.to_dict(), json_file)
+        """Saves current state of COCO dataset into json file, where `path` is absolute path with filename.
+        Uses `orjson` for serialization if it is installed.
+        """
+        if orjson is not None:
+            with open(path, 'wb') as json_file:
+                json_file.write(orjson.dumps(self.to_dict()))
+        else:
+            with open(path, 'w') as json_file:
+                json.dump(self.to_dict(), json_file)
 
 
 
@@ -140,68 +433,113 @@ class COCO:
     @property
     def annotation_ids(self) -> List[int]:
         """List of all annotation ids if Annotations are Indexed."""
-        return [
-            annotation.id
-            for annotation in self.annotations
-            if isinstance(annotation, Indexed)
-        ]
+        return [annotation.id for annotation in _filter_instances(self.annotations, Indexed)]
 
 
 
     def __post_init__(self):
-        self._cached_license_ids: List[int] = list()
-        self._cached_image_ids: List[int] = list()
-        self._cached_category_ids: List[int] = list()
-        self._cached_annotation_ids: List[int] = list()
+        self.rebuild_indexes()
 
 
-    def __trim_cached_license_ids(self):
-        self._cached_license_ids = [
-            cached_id
-            for cached_id in self._cached_license_ids
-            if cached_id not in self.license_ids
-        ]
+    def rebuild_indexes(self):
+        """Rebuilds lookup indexes of the dataset.
+        Should be called if lists of licenses, categories, images or annotations were modified directly,
+        or ids, names and file names of their items were changed, instead of using methods of the dataset.
+        """
+        self.__index_licenses()
+        self.__index_categories()
+        self.__index_images()
+        self.__index_annotations()
+        self.__update_next_ids()
+
+    def __index_licenses(self):
+        self._license_by_id = _build_index(self.licenses, 'id')
+        self._license_by_name = _build_index(self.licenses, 'name')
+
+    def __index_categories(self):
+        self._category_by_id = _build_index(self.categories or [], 'id')
+        self._category_by_name = _build_index(self.categories or [], 'name')
+        self._categories_by_supercategory = dict()
+        for category in self.categories or []:
+            _add_to_group(self._categories_by_supercategory, category.supercategory, category)
+
+    def __index_images(self):
+        self._image_by_id = _build_index(self.images, 'id')
+        self._image_by_file_name = _build_index(self.images, 'file_name')
+
+    def __index_annotations(self):
+        self._annotation_by_id = _build_index(_filter_instances(self.annotations, Indexed), 'id')
+        self._annotations_by_image_id = dict()
+        self._annotations_by_category_id = dict()
+        for annotation in self.annotations:
+            self.__group_annotation(annotation)
+
+    def __group_annotation(self, annotation: Annotation):
+        _add_to_group(self._annotations_by_image_id, annotation.image_id, annotation)
+        for category_id in self.__get_indexed_category_ids(annotation):
+            _add_to_group(self._annotations_by_category_id, category_id, annotation)
+
+    def __ungroup_annotation(self, annotation: Annotation):
+        _discard_from_group(self._annotations_by_image_id, annotation.image_id, annotation)
+        for category_id in self.__get_indexed_category_ids(annotation):
+            _discard_from_group(self._annotations_by_category_id, category_id, annotation)
+
+    def __get_indexed_category_ids(self, annotation: Annotation) -> List[int]:
+        if isinstance(annotation, (Categorized, PanopticSegmentationAnnotation)):
+            return list(dict.fromkeys(self.__get_annotation_category_ids(annotation)))
+        return list()
 
-    def __trim_cached_image_ids(self):
-        self._cached_image_ids = [
-            cached_id
-            for cached_id in self._cached_image_ids
-            if cached_id not in self.image_ids
-        ]
+    def __contains_annotation(self, annotation: Annotation) -> bool:
+        return self.__find_annotation(annotation) is not None
 
-    def __trim_cached_category_ids(self):
-        self._cached_category_ids = [
-            cached_id
-            for cached_id in self._cached_category_ids
-            if cached_id not in self.category_ids
-        ]
+    def __find_annotation(self, annotation: Annotation) -> Optional[Annotation]:
+        if isinstance(annotation, Indexed):
+            indexed = self._annotation_by_id.get(annotation.id)
+            return indexed if indexed is annotation or indexed == annotation else None
+
+        group = self._annotations_by_image_id.get(getattr(annotation, 'image_id', None), ())
+        found = next((other for other in group if other is annotation), None)
+        if found is None:
+            found = next((other for other in group if other == annotation), None)
+        return found
+
+    def __drop_annotations(self, annotations: Dict[int, Annotation]):
+        """Removes annotations, keyed by their identity, in a single pass and rebuilds annotation indexes once."""
+        if not annotations:
+            return
+
+        self.annotations = _remove_by_identity(self.annotations, annotations)
+        self.__index_annotations()
 
-    def __trim_cached_annotation_ids(self):
-        self._cached_annotation_ids = [
-            cached_id
-            for cached_id in self._cached_annotation_ids
-            if cached_id not in self.annotation_ids
-        ]
 
-    def __trim_all_cached_ids(self):
-        self.__trim_cached_license_ids()
-        self.__trim_cached_image_ids()
-        self.__trim_cached_category_ids()
-        self.__trim_cached_annotation_ids()
+    def __update_next_ids(self):
+        for kind, index in (
+            ('license', self._license_by_id), ('category', self._category_by_id),
+            ('image', self._image_by_id), ('annotation', self._annotation_by_id),
+        ):
+            self._next_ids[kind] = max(self._next_ids.get(kind, 0), max(index, default=0) + 1)
 
+    def __reserve_id(self, kind: str, id: int):
+        if id >= self._next_ids[kind]:
+            self._next_ids[kind] = id + 1
 
-    def __generate_new_id(self, present_ids: List[int], cached_ids: List[int]) -> int:
-        new_id = max(present_ids + cached_ids) + 1
-        cached_ids.append(new_id)
+    def __generate_new_id(self, kind: str) -> int:
+        new_id = self._next_ids[kind]
+        self._next_ids[kind] = new_id + 1
         return new_id
 
+    def __generate_new_ids(self, kind: str, count: int) -> List[int]:
+        start = self._next_ids[kind]
+        self._next_ids[kind] = start + count
+        return list(range(start, start + count))
+
 
     def __get_annotation_category_ids(self, annotation: Union[Categorized, PanopticSegmentationAnnotation]) -> List[int]:
         if isinstance(annotation, Categorized):
             return [annotation.category_id]
 
         elif isinstance(annotation, PanopticSegmentationAnnotation):
-            return [segment_info.category_id for segment_info in annotation.segments_info]
+            return annotation.category_ids
 
         return [-1]
 
@@ -214,63 +552,50 @@ class COCO:
         return category_ids
 
 
-    def __combine_licenses(self, new_coco: 'COCO', ignore_duplicates = True):
+    def __get_categories_images(self, categories: List[Category]) -> List[Image]:
+        image_ids = {
+            annotation.image_id
+            for category in categories
+            for annotation in self._annotations_by_category_id.get(category.id, ())
+        }
+        return [image for image in self.images if image.id in image_ids]
 
-        new_license_ids = []
-        for license in new_coco.licenses:
 
-            if not ignore_duplicates and (license.name in self.license_names):
-                current_license = self.get_license(license.name)
-                new_license_ids.append(current_license.id)
-            else:
-                new_license_ids.append(self.get_new_license_id())
+    def __combine_licenses(self, new_coco: 'COCO', ignore_duplicates = True):
 
-        new_coco.reindex_licenses(new_license_ids)
-        for license in new_coco.licenses:
-            if not license.id in self.license_ids:
-                self.append_license(license)
+        current_licenses = dict() if ignore_duplicates else self._license_by_name
+        new_coco.reindex_licenses([
+            current_license.id if current_license is not None else self.get_new_license_id()
+            for current_license in (current_licenses.get(license.name) for license in new_coco.licenses)
+        ])
+        self.extend_licenses([license for license in new_coco.licenses if license.id not in self._license_by_id])
 
 
     def __combine_categories(self, new_coco: 'COCO', ignore_duplicates = True):
         if not new_coco.categories:
             return
 
-        new_category_ids = []
-        for category in new_coco.categories:
-
-            if not ignore_duplicates and self.categories:
-                if any([
-                    category.name == self_category.name and category.supercategory == self_category.supercategory
-                    for self_category in self.categories
-                ]):
-                    current_category = self.get_category(category.name)
-                    if current_category:
-                        new_category_ids.append(current_category.id)
-                        continue
-
-            new_category_ids.append(self.get_new_category_id())
+        current_categories: Dict[Tuple[str, str], Category] = dict()
+        if not ignore_duplicates:
+            for self_category in self.categories or []:
+                current_categories.setdefault((self_category.name, self_category.supercategory), self_category)
 
-
-        new_coco.reindex_categories(new_category_ids)
-        for category in new_coco.categories:
-            if not category.id in self.category_ids:
-                self.append_category(category)
+        new_coco.reindex_categories([
+            current_category.id if current_category is not None else self.get_new_category_id()
+            for current_category in (
+                current_categories.get((category.name, category.supercategory)) for category in new_coco.categories
+            )
+        ])
+        self.extend_categories([category for category in new_coco.categories if category.id not in self._category_by_id])
 
 
     def __combine_images(self, new_coco: 'COCO', ignore_duplicates = True):
-        new_image_ids = []
-        for image in new_coco.images:
-
-            if not ignore_duplicates and (image.file_name in self.image_file_names):
-                current_image = self.get_image(image.file_name)
-                new_image_ids.append(current_image.id)
-            else:
-                new_image_ids.append(self.get_new_image_id())
-
-        new_coco.reindex_images(new_image_ids)
-        for image in new_coco.images:
-            if not image.id in self.image_ids:
-                self.append_image(image)
+        current_images = dict() if ignore_duplicates else self._image_by_file_name
+        new_coco.reindex_images([
+            current_image.id if current_image is not None else self.get_new_image_id()
+            for current_image in (current_images.get(image.file_name) for image in new_coco.images)
+        ])
+        self.extend_images([image for image in new_coco.images if image.id not in self._image_by_id])
 
 
 
@@ -293,22 +618,17 @@ class COCO:
             License: Returns License based on specified input.
         """
         if isinstance(input, int):
-            if input not in self.license_ids:
-                return None
-
-            return next(license for license in self.licenses if license.id == input)
+            return self._license_by_id.get(input)
 
         elif isinstance(input, str):
-            if input not in self.license_names:
-                return None
-
-            return next(license for license in self.licenses if license.name == input)
+            return self._license_by_name.get(input)
 
         elif isinstance(input, Image):
-            if input not in self.images:
+            image = self._image_by_id.get(input.id)
+            if image is not input and image != input:
                 return None
 
-            return next(license for license in self.licenses if license.id == input.license)
+            return self._license_by_id.get(input.license)
 
         raise TypeError('Input argument of unexpected type.')
 
@@ -325,11 +645,11 @@ class COCO:
         Returns:
             List[License]: Returns List of licenses based on the given list of images.
         """
-        if not isinstances(images, Image):
+        if images and not isinstance(images[0], Image):
             raise TypeError('Input argument of unexpected type.')
 
-        license_ids = {self.get_license(image).id for image in images}
-        return [self.get_license(id) for id in license_ids]
+        license_ids = {image.license for image in images}
+        return [license for license in self.licenses if license.id in license_ids]
 
 
     @overload
@@ -357,22 +677,20 @@ class COCO:
             return None
 
         if isinstance(input, int):
-            if input not in self.category_ids:
-                return None
-
-            return next(category for category in self.categories if category.id == input)
+            return self._category_by_id.get(input)
 
         elif isinstance(input, str):
-            if input not in self.category_names:
-                return None
-
-            return next(category for category in self.categories if category.name == input)
+            return self._category_by_name.get(input)
 
         elif isinstance(input, (Categorized, PanopticSegmentationAnnotation)):
-            if input not in self.annotations:
+            if not self.__contains_annotation(input):
                 return None
 
-            return next(category for category in self.categories if category.id in self.__get_annotation_category_ids(input))
+            if isinstance(input, Categorized):
+                return self._category_by_id.get(input.category_id)
+
+            category_ids = set(self.__get_annotation_category_ids(input))
+            return next((category for category in self.categories if category.id in category_ids), None)
 
         raise TypeError('Input argument of unexpected type.')
 
@@ -404,29 +722,23 @@ class COCO:
             return list()
 
         if isinstance(input, str):
-            return [category for category in self.categories if category.supercategory == input]
+            return list(self._categories_by_supercategory.get(input, ()))
 
         elif isinstance(input, Image):
-            return [
-                category
-                for category in self.categories
-                if category.id in self.__get_annotations_category_ids(self.get_annotations(input))
-            ]
+            category_ids = set(self.__get_annotations_category_ids(self._annotations_by_image_id.get(input.id, [])))
+            return [category for category in self.categories if category.id in category_ids]
 
         elif isinstance(input, list):
-            if isinstances(input, Image):
-                return [
-                    category
-                    for category in self.categories
-                    if category.id in self.__get_annotations_category_ids(self.get_annotations(input))
-                ]
-
-            elif isinstances(input, (Categorized, PanopticSegmentationAnnotation)):
-                return [
-                    category
-                    for category in self.categories
-                    if category.id in self.__get_annotations_category_ids(input)
-                ]
+            if isinstances_sampled(input, Image):
+                # order of annotations does not matter for the set of ids, so they are taken straight from the index.
+                category_ids = set(self.__get_annotations_category_ids(list(chain.from_iterable(
+                    self._annotations_by_image_id.get(image.id, ()) for image in input
+                ))))
+                return [category for category in self.categories if category.id in category_ids]
+
+            elif isinstances_sampled(input, (Categorized, PanopticSegmentationAnnotation)):
+                category_ids = set(self.__get_annotations_category_ids(input))
+                return [category for category in self.categories if category.id in category_ids]
 
         raise TypeError('Input argument of unexpected type.')
 
@@ -451,22 +763,16 @@ class COCO:
             Image: Returns image based on specified input.
         """
         if isinstance(input, int):
-            if input not in self.image_ids:
-                return None
-
-            return next(image for image in self.images if image.id == input)
+            return self._image_by_id.get(input)
 
         elif isinstance(input, str):
-            if input not in self.image_file_names:
-                return None
-
-            return next(image for image in self.images if image.file_name == input)
+            return self._image_by_file_name.get(input)
 
         elif isinstance(input, Annotation):
-            if input not in self.annotations:
+            if not self.__contains_annotation(input):
                 return None
 
-            return next(image for image in self.images if image.id == input.image_id)
+            return self._image_by_id.get(input.image_id)
 
         raise TypeError('Input argument of unexpected type.')
 
@@ -500,28 +806,22 @@ class COCO:
             return [image for image in self.images if image.license == input]
 
         elif isinstance(input, str):
-            return [image for image in self.images if image.license == self.get_license(input).id]
+            license = self._license_by_name.get(input)
+            return [image for image in self.images if image.license == license.id] if license else list()
 
         elif isinstance(input, License):
             return [image for image in self.images if image.license == input.id]
 
         elif isinstance(input, Category) and self.categories:
-            return [
-                image
-                for image in self.images
-                if input.id in [category.id for category in self.get_categories(image)]
-            ]
+            return self.__get_categories_images([input])
 
         elif isinstance(input, list):
-            if isinstances(input, Annotation):
-                return [
-                    image
-                    for image in self.images
-                    if image.id in [annotation.image_id for annotation in input]
-                ]
+            if isinstances_sampled(input, Annotation):
+                image_ids = {annotation.image_id for annotation in input}
+                return [image for image in self.images if image.id in image_ids]
 
-            elif isinstances(input, Category) and self.categories:
-                return sum([self.get_images(category) for category in input], [])
+            elif isinstances_sampled(input, Category) and self.categories:
+                return self.__get_categories_images(input)
 
         raise TypeError('Input argument of unexpected type.')
 
@@ -538,13 +838,9 @@ class COCO:
         Returns:
             Annotation: Returns annotation based on specified id.
         """
-        if id in self.annotation_ids and isinstance(id, int):
-            return next(
-                cast(Annotation, annotation)
-                for annotation in self.annotations
-                if isinstance(annotation, Indexed)
-                if annotation.id == id
-            )
+        annotation = self._annotation_by_id.get(id) if isinstance(id, int) else None
+        if annotation is not None:
+            return cast(Annotation, annotation)
 
         raise TypeError('Input argument of unexpected type.')
 
@@ -570,25 +866,19 @@ class COCO:
             List[Annotation]: Returns List of annotations based on the given input.
         """
         if isinstance(input, int):
-            return [annotation for annotation in self.annotations if annotation.image_id == input]
+            return list(self._annotations_by_image_id.get(input, ()))
 
         elif isinstance(input, str):
-            return [
-                annotation
-                for annotation in self.annotations
-                if self.get_image(annotation.image_id).file_name == input
-            ]
+            image = self._image_by_file_name.get(input)
+            return list(self._annotations_by_image_id.get(image.id, ())) if image else list()
 
         elif isinstance(input, Image):
-            return [annotation for annotation in self.annotations if annotation.image_id == input.id]
+            return list(self._annotations_by_image_id.get(input.id, ()))
 
         elif isinstance(input, list):
-            if isinstances(input, Image):
-                return [
-                    annotation
-                    for annotation in self.annotations
-                    if annotation.image_id in [image.id for image in input]
-                ]
+            if isinstances_sampled(input, Image):
+                image_ids = {image.id for image in input}
+                return [annotation for annotation in self.annotations if annotation.image_id in image_ids]
 
         raise TypeError('Input argument of unexpected type.')
 
@@ -613,34 +903,28 @@ class COCO:
         Returns:
             List[Annotation]: Returns List of annotations based on the given input.
         """
-        if not self.categories or not isinstances(self.annotations, (Categorized, PanopticSegmentationAnnotation)):
+        # only categorized and panoptic annotations are grouped by category, so mixed lists need no check.
+        if not self.categories:
             return list()
 
         if isinstance(input, int):
-            return [annotation for annotation in self.annotations if annotation.category_id == input]
+            return list(self._annotations_by_category_id.get(input, ()))
 
         elif isinstance(input, str):
-            return [
-                annotation
-                for annotation in self.annotations
-                if self.get_category(annotation.category_id).name == input
-            ]
+            category = self._category_by_name.get(input)
+            return list(self._annotations_by_category_id.get(category.id, ())) if category else list()
 
         elif isinstance(input, Category):
-            return [
-                annotation for annotation in self.annotations 
-                if input.id in self.__get_annotation_category_ids(annotation)
-            ]
+            return list(self._annotations_by_category_id.get(input.id, ()))
 
         elif isinstance(input, list):
-            if isinstances(input, Category):
-                return [
-                    annotation
-                    for annotation in self.annotations
-                    if set([category.id for category in input]).intersection(
-                        self.__get_annotation_category_ids(annotation)
-                    )
-                ]
+            if isinstances_sampled(input, Category):
+                matched = {
+                    id(annotation)
+                    for category in input
+                    for annotation in self._annotations_by_category_id.get(category.id, ())
+                }
+                return [annotation for annotation in self.annotations if id(annotation) in matched]
 
         raise TypeError('Input argument of unexpected type.')
 
@@ -659,41 +943,42 @@ class COCO:
         if not isinstance(supercategory, str):
             raise TypeError('Input argument of unexpected type.')
 
-        if not self.categories or not isinstances(self.annotations, (Categorized, PanopticSegmentationAnnotation)):
+        if not self.categories:
             return list()
 
-        return [
-            annotation
-            for annotation in self.annotations
-            if isinstance(annotation, (Categorized, PanopticSegmentationAnnotation))
-            if set(self.__get_annotation_category_ids(annotation)).intersection([
-                category.id for category in self.get_categories(supercategory)
-            ])
+        groups = [
+            group for category in self._categories_by_supercategory.get(supercategory, ())
+            if (group := self._annotations_by_category_id.get(category.id))
         ]
+        if len(groups) <= 1:
+            return list(groups[0]) if groups else list()
+
+        # annotations of several categories are collected in dataset order,
+        # panoptic annotation may be grouped under several categories of the same supercategory.
+        annotations = {id(annotation) for group in groups for annotation in group}
+        return [annotation for annotation in self.annotations if id(annotation) in annotations]
 
 
     def clear_cached_ids(self):
-        """Clears cached ids that were generated by the `get_new_[]_id` methods."""
-        self._cached_license_ids: List[int] = list()
-        self._cached_image_ids: List[int] = list()
-        self._cached_category_ids: List[int] = list()
-        self._cached_annotation_ids: List[int] = list()
+        """Resets counters of the `get_new_[]_id` methods, so new ids continue from the largest id present in the dataset."""
+        self._next_ids.clear()
+        self.__update_next_ids()
 
     def get_new_license_id(self) -> int:
         """Generate new id for the license."""
-        return self.__generate_new_id(self.license_ids, self._cached_license_ids)
+        return self.__generate_new_id('license')
 
     def get_new_category_id(self) -> int:
         """Generate new id for the category."""
-        return self.__generate_new_id(self.category_ids, self._cached_category_ids)
+        return self.__generate_new_id('category')
 
     def get_new_image_id(self) -> int:
         """Generate new id for the image."""
-        return self.__generate_new_id(self.image_ids, self._cached_image_ids)
+        return self.__generate_new_id('image')
 
     def get_new_annotation_id(self) -> int:
         """Generate new id for the annotation."""
-        return self.__generate_new_id(self.annotation_ids, self._cached_annotation_ids)
+        return self.__generate_new_id('annotation')
 
 
 
@@ -710,14 +995,16 @@ class COCO:
         if not isinstance(license, License):
             raise TypeError('Input argument of unexpected type.')
 
-        if license.id in self.license_ids:
+        if license.id in self._license_by_id:
             raise ValueError(
                 f"License with ID {license.id} already exists."
                 "Consider using get_new_license_id() function when assigning ID to the object."
             )
 
         self.licenses.append(license)
-        self.__trim_cached_license_ids()
+        self._license_by_id.setdefault(license.id, license)
+        self._license_by_name.setdefault(license.name, license)
+        self.__reserve_id('license', license.id)
 
     def extend_licenses(self, licenses: List[License]):
         """Extends dataset with the given Licenses. Consider reindexing licenses with the `get_new_license_id()`.
@@ -729,7 +1016,14 @@ class COCO:
             TypeError: If passed arguments is not of type License
             ValueError: If one of the Licenses with given Id already present.
         """
-        [self.append_license(license) for license in licenses]
+        new_ids = _validate_new_items(licenses, License, self._license_by_id, 'license')
+        self.licenses.extend(licenses)
+        for license in licenses:
+            self._license_by_id[license.id] = license
+            self._license_by_name.setdefault(license.name, license)
+
+        if new_ids:
+            self.__reserve_id('license', max(new_ids))
 
 
     def append_category(self, category: Category):
@@ -748,14 +1042,17 @@ class COCO:
         if not isinstance(category, Category):
             raise TypeError('Input argument of unexpected type.')
 
-        if category.id in self.category_ids:
+        if category.id in self._category_by_id:
             raise ValueError(
                 f"Category with ID {category.id} already exists."
                 "Consider using get_new_category_id() function when assigning ID to the object."
             )
 
         self.categories.append(category)
-        self.__trim_cached_category_ids()
+        self._category_by_id.setdefault(category.id, category)
+        self._category_by_name.setdefault(category.name, category)
+        _add_to_group(self._categories_by_supercategory, category.supercategory, category)
+        self.__reserve_id('category', category.id)
 
     def extend_categories(self, categories: List[Category]):
         """Extends dataset with the given Categories. Consider reindexing categories with the `get_new_category_id()`.
@@ -767,7 +1064,20 @@ class COCO:
             TypeError: If passed arguments is not of type Category
             ValueError: If one of the Categories with given Id already present.
         """
-        [self.append_category(category) for category in categories]
+        new_ids = _validate_new_items(categories, Category, self._category_by_id, 'category')
+        if not new_ids:
+            return
+
+        if not self.categories:
+            self.categories = list()
+
+        self.categories.extend(categories)
+        for category in categories:
+            self._category_by_id[category.id] = category
+            self._category_by_name.setdefault(category.name, category)
+            _add_to_group(self._categories_by_supercategory, category.supercategory, category)
+
+        self.__reserve_id('category', max(new_ids))
 
 
     def append_image(self, image: Image):
@@ -783,14 +1093,16 @@ class COCO:
         if not isinstance(image, Image):
             raise TypeError('Input argument of unexpected type.')
 
-        if image.id in self.image_ids:
+        if image.id in self._image_by_id:
             raise ValueError(
                 f"Image with ID {image.id} already exists."
                 "Consider using get_new_image_id() function when assigning ID to the object."
             )
 
         self.images.append(image)
-        self.__trim_cached_image_ids()
+        self._image_by_id.setdefault(image.id, image)
+        self._image_by_file_name.setdefault(image.file_name, image)
+        self.__reserve_id('image', image.id)
 
     def extend_images(self, images: List[Image]):
         """Extends dataset with the given Images. Consider reindexing images with the `get_new_image_id()`.
@@ -802,7 +1114,14 @@ class COCO:
             TypeError: If passed arguments is not of type Image
             ValueError: If one of the Images with given Id already present.
         """
-        [self.append_image(image) for image in images]
+        new_ids = _validate_new_items(images, Image, self._image_by_id, 'image')
+        self.images.extend(images)
+        for image in images:
+            self._image_by_id[image.id] = image
+            self._image_by_file_name.setdefault(image.file_name, image)
+
+        if new_ids:
+            self.__reserve_id('image', max(new_ids))
 
 
     def append_annotation(self, annotation: Annotation):
@@ -819,14 +1138,17 @@ class COCO:
             raise TypeError('Input argument of unexpected type.')
 
         if isinstance(annotation, Indexed):
-            if annotation.id in self.annotation_ids:
+            if annotation.id in self._annotation_by_id:
                 raise ValueError(
                     f"Annotation with ID {annotation.id} already exists."
                     "Consider using get_new_annotation_id() function when assigning ID to the object."
                 )
 
+            self._annotation_by_id.setdefault(annotation.id, annotation)
+            self.__reserve_id('annotation', annotation.id)
+
         self.annotations.append(annotation)
-        self.__trim_cached_annotation_ids()
+        self.__group_annotation(annotation)
 
     def extend_annotations(self, annotations: List[Annotation]):
         """Extends dataset with the given Annotations. Consider reindexing annotations with the `get_new_annotation_id()`.
@@ -838,7 +1160,33 @@ class COCO:
             TypeError: If passed arguments is not of type Annotation
             ValueError: If one of the Annotations with given Id already present.
         """
-        [self.append_annotation(annotation) for annotation in annotations]
+        # protocol checks are costly, so they are done once per concrete class of the annotations.
+        indexed_types: Dict[type, bool] = dict()
+        new_ids = set()
+        for annotation in annotations:
+            indexed = indexed_types.get(type(annotation))
+            if indexed is None:
+                if not isinstance(annotation, Annotation):
+                    raise TypeError('Input argument of unexpected type.')
+                indexed = indexed_types[type(annotation)] = isinstance(annotation, Indexed)
+
+            if indexed:
+                if annotation.id in self._annotation_by_id or annotation.id in new_ids:
+                    raise ValueError(
+                        f"Annotation with ID {annotation.id} already exists."
+                        "Consider using get_new_annotation_id() function when assigning ID to the object."
+                    )
+                new_ids.add(annotation.id)
+
+        # all annotations are validated upfront, so dataset is extended at once and is never left partially extended.
+        self.annotations.extend(annotations)
+        for annotation in annotations:
+            if indexed_types[type(annotation)]:
+                self._annotation_by_id[annotation.id] = annotation
+            self.__group_annotation(annotation)
+
+        if new_ids:
+            self.__reserve_id('annotation', max(new_ids))
 
 
 
@@ -850,10 +1198,12 @@ class COCO:
             remove_images (bool, optional): Remove images that corresponds to this license. Defaults to True.
             remove_annotations (bool, optional): Remove annotations that corresponds to removed images. Defaults to True.
         """
-        if license not in self.licenses:
+        if not _find_indexed([license], self._license_by_id):
             return
 
-        self.licenses.remove(license)
+        license = self.licenses.pop(self.licenses.index(license))
+        _discard_from_index(self._license_by_id, self.licenses, 'id', license)
+        _discard_from_index(self._license_by_name, self.licenses, 'name', license)
         if remove_images:
             self.remove_images(self.get_images(license), remove_annotations)
 
@@ -865,7 +1215,15 @@ class COCO:
             remove_images (bool, optional): Remove images that corresponds to the licenses. Defaults to True.
             remove_annotations (bool, optional): Remove annotations that corresponds to removed images. Defaults to True.
         """
-        [self.remove_license(license, remove_images, remove_annotations) for license in licenses]
+        removed = _find_indexed(licenses, self._license_by_id)
+        if not removed:
+            return
+
+        self.licenses = _remove_by_identity(self.licenses, removed)
+        self.__index_licenses()
+        if remove_images:
+            license_ids = {license.id for license in removed.values()}
+            self.remove_images([image for image in self.images if image.license in license_ids], remove_annotations)
 
     def remove_category(self, category: Category, remove_annotations = True):
         """Removes Category from the dataset and corresponding connections.
@@ -875,13 +1233,20 @@ class COCO:
             remove_annotations (bool, optional): Remove annotations that corresponds to removed category. Defaults to True.
         """
         if self.categories:
-            if category not in self.categories:
+            if not _find_indexed([category], self._category_by_id):
                 return
 
-            self.categories.remove(category)
+            category = self.categories.pop(self.categories.index(category))
+            _discard_from_index(self._category_by_id, self.categories, 'id', category)
+            _discard_from_index(self._category_by_name, self.categories, 'name', category)
+            _discard_from_group(self._categories_by_supercategory, category.supercategory, category)
 
             if remove_annotations:
-                self.remove_annotaitons(self.get_annotations_by_category(category))
+                # index is read directly, as `get_annotations_by_category` finds nothing once the last category is removed.
+                self.__drop_annotations({
+                    id(annotation): annotation
+                    for annotation in self._annotations_by_category_id.get(category.id, ())
+                })
 
     def remove_categories(self, categories: List[Category], remove_annotations = True):
         """Removes Categories from the dataset and corresponding connections.
@@ -890,7 +1255,21 @@ class COCO:
             categories (List[Category]): Categories to remove.
             remove_annotations (bool, optional): Remove annotations that corresponds to removed categories. Defaults to True.
         """
-        [self.remove_category(category, remove_annotations) for category in categories]
+        if not self.categories:
+            return
+
+        removed = _find_indexed(categories, self._category_by_id)
+        if not removed:
+            return
+
+        self.categories = _remove_by_identity(self.categories, removed)
+        self.__index_categories()
+        if remove_annotations:
+            self.__drop_annotations({
+                id(annotation): annotation
+                for category in removed.values()
+                for annotation in self._annotations_by_category_id.get(category.id, ())
+            })
 
     def remove_image(self, image: Image, remove_annotations = True):
         """Removes Image from the dataset and corresponding connections.
@@ -899,12 +1278,14 @@ class COCO:
             image (Image): Image to remove.
             remove_annotations (bool, optional): Remove annotations that corresponds to removed image. Defaults to True.
         """
-        if image not in self.images:
+        if not _find_indexed([image], self._image_by_id):
             return
 
-        self.images.remove(image)
+        image = self.images.pop(self.images.index(image))
+        _discard_from_index(self._image_by_id, self.images, 'id', image)
+        _discard_from_index(self._image_by_file_name, self.images, 'file_name', image)
         if remove_annotations:
-            self.remove_annotaitons(self.get_annotations(image))
+            self.remove_annotations(self.get_annotations(image))
 
     def remove_images(self, images: List[Image], remove_annotations = True):
         """Removes Images from the dataset and corresponding connections.
@@ -913,7 +1294,18 @@ class COCO:
             images (List[Image]): Images to remove.
             remove_annotations (bool, optional): Remove annotations that corresponds to removed images. Defaults to True.
         """
-        [self.remove_image(image, remove_annotations) for image in images]
+        removed = _find_indexed(images, self._image_by_id)
+        if not removed:
+            return
+
+        self.images = _remove_by_identity(self.images, removed)
+        self.__index_images()
+        if remove_annotations:
+            self.__drop_annotations({
+                id(annotation): annotation
+                for image in removed.values()
+                for annotation in self._annotations_by_image_id.get(image.id, ())
+            })
 
     def remove_annotation(self, annotation: Annotation):
         """Removes Annotation from the dataset.
@@ -921,24 +1313,101 @@ class COCO:
         Args:
             annotation (Annotation): Annotation to remove.
         """
-        if annotation not in self.annotations:
+        annotation = self.__find_annotation(annotation)
+        if annotation is None:
             return
 
-        self.annotations.remove(annotation)
+        annotation = self.annotations.pop(self.annotations.index(annotation))
 
-    def remove_annotaitons(self, annotations: List[Annotation]):
+        if isinstance(annotation, Indexed):
+            _discard_from_index(self._annotation_by_id, self.annotations, 'id', annotation)
+        self.__ungroup_annotation(annotation)
+
+    def remove_annotations(self, annotations: List[Annotation]):
         """Removes Annotations from the dataset.
 
         Args:
             annotations (List[Annotation]): Annotations to remove.
         """
-        [self.remove_annotation(annotation) for annotation in annotations]
+        removed: Dict[int, Annotation] = dict()
+        for annotation in annotations:
+            annotation = self.__find_annotation(annotation)
+            if annotation is not None:
+                removed[id(annotation)] = annotation
+
+        self.__drop_annotations(removed)
+
+    # misspelled name is kept for backward compatibility.
+    remove_annotaitons = remove_annotations
 
 
     def clean_dataset(self):
-        """Cleans dataset from unused elements, and reindex all elements and their connections."""
-        self.trim_dataset()
-        self.reindex_dataset()
+        """Cleans dataset from unused elements, and reindex all elements and their connections.
+        Result is the same as of `trim_dataset` followed by `reindex_dataset`, but every list is trimmed and reindexed
+        in a single pass with dictionary remaps of the ids, and lookup indexes are rebuilt only once at the end.
+        """
+        # trimming follows the order of `trim_dataset`.
+        self.annotations = [annotation for annotation in self.annotations if annotation.image_id in self._image_by_id]
+
+        used_image_ids = {annotation.image_id for annotation in self.annotations}
+        self.images = [
+            image
+            for image in self.images
+            if image.id in used_image_ids and image.license in self._license_by_id
+        ]
+
+        samples = {type(annotation): annotation for annotation in self.annotations}
+        kinds = {
+            annotation_type: (
+                isinstance(sample, Indexed),
+                isinstance(sample, Categorized),
+                isinstance(sample, PanopticSegmentationAnnotation),
+            )
+            for annotation_type, sample in samples.items()
+        }
+
+        # same as `trim_categories`, uncategorized annotations are ignored.
+        used_category_ids: Set[int] = set()
+        for annotation in self.annotations:
+            _, categorized, panoptic = kinds[type(annotation)]
+            if categorized:
+                used_category_ids.add(annotation.category_id)
+            elif panoptic:
+                used_category_ids.update(annotation.category_ids)
+        if self.categories and (used_category_ids or not self.annotations):
+            self.categories = [category for category in self.categories if category.id in used_category_ids]
+
+        used_license_ids = {image.license for image in self.images}
+        self.licenses = [license for license in self.licenses if license.id in used_license_ids]
+
+        # every item gets its position as id, references to the items are remapped with the same dictionaries.
+        image_ids = {image.id: new_id for new_id, image in enumerate(self.images)}
+        category_ids = {category.id: new_id for new_id, category in enumerate(self.categories or [])}
+        license_ids = {license.id: new_id for new_id, license in enumerate(self.licenses)}
+
+        for new_id, annotation in enumerate(self.annotations):
+            indexed, categorized, panoptic = kinds[type(annotation)]
+            if indexed:
+                annotation.id = new_id
+            annotation.image_id = image_ids.get(annotation.image_id, annotation.image_id)
+            if categorized:
+                annotation.category_id = category_ids.get(annotation.category_id, annotation.category_id)
+            elif panoptic:
+                for segment_info in annotation.segments_info:
+                    segment_info.category_id = category_ids.get(segment_info.category_id, segment_info.category_id)
+
+        for new_id, image in enumerate(self.images):
+            image.id = new_id
+            image.license = license_ids.get(image.license, image.license)
+
+        for new_id, category in enumerate(self.categories or []):
+            category.id = new_id
+
+        for new_id, license in enumerate(self.licenses):
+            license.id = new_id
+
+        self._next_ids.clear()
+        self.rebuild_indexes()
 
     def trim_dataset(self):
         """Trims dataset by removing unused annotations, images, categories, licenses."""
@@ -949,37 +1418,40 @@ class COCO:
 
     def trim_licenses(self):
         """Removes unused licenses."""
-        self.licenses = [
-            license
-            for license in self.licenses
-            if license.id in [image.license for image in self.images]
-        ]
+        used_license_ids = {image.license for image in self.images}
+        self.licenses = [license for license in self.licenses if license.id in used_license_ids]
+        self.__index_licenses()
 
     def trim_categories(self):
         """Removes unused categories."""
-        if self.categories and isinstances(self.annotations, Categorized):
+        # only ids of categories that have annotations are present in the index, which ignores uncategorized annotations.
+        # categories of datasets that have only uncategorized annotations, e.g. captions, are kept.
+        if self.categories and (self._annotations_by_category_id or not self.annotations):
             self.categories = [
                 category
                 for category in self.categories
-                if category.id in [annotation.category_id for annotation in self.annotations]
+                if category.id in self._annotations_by_category_id
             ]
+            self.__index_categories()
 
     def trim_images(self):
         """Removes unused images."""
         self.images = [
             image
             for image in self.images
-            if image.id in [annotation.image_id for annotation in self.annotations]
-            and image.license in self.license_ids
+            if image.id in self._annotations_by_image_id
+            and image.license in self._license_by_id
         ]
+        self.__index_images()
 
     def trim_annotations(self):
         """Removes unused annotations."""
         self.annotations = [
             annotation
             for annotation in self.annotations
-            if annotation.image_id in self.image_ids
+            if annotation.image_id in self._image_by_id
         ]
+        self.__index_annotations()
 
 
 
@@ -1002,9 +1474,15 @@ class COCO:
         if new_id is None:
             new_id = self.get_new_license_id()
 
-        for image in self.get_images(license):
+        self.__reindex_license(license, new_id, {license.id: self.get_images(license)})
+
+    def __reindex_license(self, license: License, new_id: int, images_by_license: Dict[int, List[Image]]):
+        for image in images_by_license.get(license.id, ()):
             image.license = new_id
 
+        _move_group(images_by_license, license.id, new_id)
+        _move_in_index(self._license_by_id, license.id, new_id, license)
+        self.__reserve_id('license', new_id)
         license.id = new_id
 
     def reindex_licenses(self, new_ids: List[int] = None):
@@ -1023,13 +1501,18 @@ class COCO:
         if len(new_ids) != len(self.licenses):
             raise ValueError('Inapropirate amount of ids. Length of new_ids should be equal to the length of licenses.')
 
+        # images are grouped by license once, instead of scanning all images for every reindexed license.
+        images_by_license: Dict[int, List[Image]] = dict()
+        for image in self.images:
+            _add_to_group(images_by_license, image.license, image)
+
         for new_id in new_ids:
-            if new_id in self.license_ids:
+            if new_id in self._license_by_id:
                 duplicated_license = self.get_license(new_id)
-                self.reindex_license(duplicated_license, self.get_new_license_id())
+                self.__reindex_license(duplicated_license, self.get_new_license_id(), images_by_license)
 
         for new_id, license in zip(new_ids, self.licenses):
-            self.reindex_license(license, new_id)
+            self.__reindex_license(license, new_id, images_by_license)
 
 
     def reindex_category(self, category: Category, new_id: int = None):
@@ -1054,6 +1537,9 @@ class COCO:
                     if segment_info.category_id == category.id:
                         segment_info.category_id = new_id
 
+        _move_group(self._annotations_by_category_id, category.id, new_id)
+        _move_in_index(self._category_by_id, category.id, new_id, category)
+        self.__reserve_id('category', new_id)
         category.id = new_id
 
     def reindex_categories(self, new_ids: List[int] = None):
@@ -1076,7 +1562,7 @@ class COCO:
             raise ValueError('Inapropirate amount of ids. Length of new_ids should be equal to the length of categories.')
 
         for new_id, category in zip(new_ids, self.categories):
-            if new_id in self.category_ids:
+            if new_id in self._category_by_id:
                 duplicated_category = self.get_category(new_id)
                 if duplicated_category:
                     self.reindex_category(duplicated_category, self.get_new_category_id())
@@ -1097,6 +1583,9 @@ class COCO:
         for annotation in self.get_annotations(image):
             annotation.image_id = new_id
 
+        _move_group(self._annotations_by_image_id, image.id, new_id)
+        _move_in_index(self._image_by_id, image.id, new_id, image)
+        self.__reserve_id('image', new_id)
         image.id = new_id
 
     def reindex_images(self, new_ids: List[int] = None):
@@ -1117,7 +1606,7 @@ class COCO:
 
         for new_id, image in zip(new_ids, self.images):
 
-            if new_id in self.image_ids:
+            if new_id in self._image_by_id:
                 duplicated_image = self.get_image(new_id)
                 self.reindex_image(duplicated_image, self.get_new_image_id())
 
@@ -1135,6 +1624,8 @@ class COCO:
             new_id = self.get_new_annotation_id()
 
         if isinstance(annotation, Indexed):
+            _move_in_index(self._annotation_by_id, annotation.id, new_id, annotation)
+            self.__reserve_id('annotation', new_id)
             annotation.id = new_id
 
     def reindex_annotations(self, new_ids: List[int] = None):
@@ -1155,7 +1646,7 @@ class COCO:
 
         for new_id, annotation in zip(new_ids, self.annotations):
 
-            if new_id in self.annotation_ids:
+            if new_id in self._annotation_by_id:
                 duplicated_annotation = self.get_annotation(new_id)
                 self.reindex_annotation(duplicated_annotation, self.get_new_annotation_id())
 
@@ -1163,7 +1654,7 @@ class COCO:
 
 
 
-    def combine(self, new_coco: 'COCO', ignore_duplicates = True):
+    def combine(self, new_coco: 'COCO', ignore_duplicates = True, take_ownership = False):
         """Combines another COCO dataset with the current one.
         Info stays the same, however Licenses, categories, images and annotations are combined.
 
@@ -1171,26 +1662,33 @@ class COCO:
             new_coco (COCO): Another COCO dataset that will be combined with current one.
             ignore_duplicates (bool, optional): If True duplicated licenses, categories, images and annotations will be kept.
                 If False duplicated elements will be removed. Defaults to True.
+            take_ownership (bool, optional): Move items of `new_coco` into the current dataset without copying them.
+                Items are reindexed in place, so `new_coco` should not be used afterwards.
+                Ignored if `new_coco` is the current dataset itself, which is always copied. Defaults to False.
         """
-        new_coco = deepcopy(new_coco)
+        if not take_ownership or new_coco is self:
+            new_coco = deepcopy(new_coco)
 
         self.__combine_licenses(new_coco, ignore_duplicates)
         self.__combine_categories(new_coco, ignore_duplicates)
         self.__combine_images(new_coco, ignore_duplicates)
 
-        new_coco.reindex_annotations([self.get_new_annotation_id() for _ in new_coco.annotations])
+        new_coco.reindex_annotations(self.__generate_new_ids('annotation', len(new_coco.annotations)))
         self.extend_annotations(new_coco.annotations)
 
         self.clear_cached_ids()
 
 
-    def split(self, percentage: float, seed: int = 101) -> Tuple['COCO']:
+    def split(self, percentage: float, seed: int = 101, deep_copy = True) -> Tuple['COCO']:
         """Splits dataset in two parts based on the specified percentage.
         Splitting process is perfromed on images.
 
         Args:
             percentage (float): Value between 0 and 1 that that will be used during splitting.
             seed (int): random seed.
+            deep_copy (bool, optional): Deep copy items of the dataset into the parts. If False, items are copied shallowly,
+                which is much cheaper: ids of the parts can be changed and reindexed independently, but nested values,
+                such as segmentations and bounding boxes, are shared with the current dataset. Defaults to True.
 
         Raises:
             ValueError: If percentage arguments is not between 0 and 1
@@ -1201,21 +1699,42 @@ class COCO:
         if percentage > 1.0 or percentage < 0.0:
             raise ValueError('percentage should be between 0 and 1.')
 
-        images = deepcopy(self.images)
-
-        random.seed(seed)
-        random.shuffle(images)
+        # local generator keeps the global random state untouched.
+        images = list(self.images)
+        random.Random(seed).shuffle(images)
 
         point = int(len(self.images) * percentage)
-        datasets: Any = tuple()
+        splits = (images[:point], images[point:])
 
-        for subimages in [images[:point], images[point:]]:
+        # annotations are distributed between both parts in a single pass, keeping their order.
+        split_by_image_id = {image.id: index for index, subimages in enumerate(splits) for image in subimages}
+        annotations: Tuple[List[Annotation], List[Annotation]] = (list(), list())
+        for annotation in self.annotations:
+            index = split_by_image_id.get(annotation.image_id)
+            if index is not None:
+                annotations[index].append(annotation)
+
+        datasets: Any = tuple()
+        for subimages, subannotations in zip(splits, annotations):
+            category_ids = set(self.__get_annotations_category_ids(subannotations))
+            info = self.info
+            licenses = self.get_licenses(subimages)
+            categories = [category for category in self.categories or [] if category.id in category_ids]
+            if deep_copy:
+                info, licenses, subimages, subannotations, categories = deepcopy(
+                    (info, licenses, subimages, subannotations, categories)
+                )
+            else:
+                info = copy(info)
+                licenses, subimages, subannotations, categories = (
+                    [_copy_item(item) for item in items] for items in (licenses, subimages, subannotations, categories)
+                )
             datasets += COCO(
-                info = deepcopy(self.info),
-                licenses = deepcopy(self.get_licenses(subimages)),
+                info = info,
+                licenses = licenses,
                 images = subimages,
-                annotations = deepcopy(self.get_annotations(subimages)),
-                categories = deepcopy(self.get_categories(subimages))
+                annotations = subannotations,
+                categories = categories
             ),
 
         return datasets
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Callable, ClassVar, Dict
 
-from structures.types import compare_dict_structure
+from structures.types import compare_dict_structure, generate_dumper, generate_loader
 
 
-@dataclass
+@dataclass(slots=True)
 class Image:
     """Dataclass that mimics Image structure of COCO dataset."""
     id: int
@@ -16,6 +16,9 @@ class Image:
     coco_url: str = ""
     date_captured: str = ""
 
+    _load: ClassVar[Callable[[Dict[str, Any]], 'Image']]
+    to_dict: ClassVar[Callable[['Image'], Dict[str, Any]]]
+
     @classmethod
     def from_dict(cls, image_dict: Dict[str, Any], ignore_extra_keys = True):
         """Generates Image dataclass from dictionary.
@@ -28,4 +31,8 @@ class Image:
             Image: Object generated from dictionary.
         """
         compare_dict_structure(image_dict, cls, ignore_extra_keys)
-        return cls(**image_dict)
+        return cls._load(image_dict)
+
+
+Image._load = staticmethod(generate_loader(Image))
+Image.to_dict = generate_dumper(Image)
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Callable, ClassVar, Dict
 
-from structures.types import compare_dict_structure
+from structures.types import compare_dict_structure, generate_dumper, generate_loader
 
 
-@dataclass
+@dataclass(slots=True)
 class Info:
     """Dataclass that mimics Info structure of COCO dataset."""
     year: int = 0
@@ -14,6 +14,9 @@ class Info:
     url: str = ""
     date_created: str = ""
 
+    _load: ClassVar[Callable[[Dict[str, Any]], 'Info']]
+    to_dict: ClassVar[Callable[['Info'], Dict[str, Any]]]
+
     @classmethod
     def from_dict(cls, info_dict: Dict[str, Any], ignore_extra_keys = True):
         """Generates Info dataclass from dictionary.
@@ -26,4 +29,8 @@ class Info:
             Info: Object generated from dictionary.
         """
         compare_dict_structure(info_dict, cls, ignore_extra_keys)
-        return cls(**info_dict)
+        return cls._load(info_dict)
+
+
+Info._load = staticmethod(generate_loader(Info))
+Info.to_dict = generate_dumper(Info)
@@ -1,16 +1,19 @@
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Callable, ClassVar, Dict
 
-from structures.types import compare_dict_structure
+from structures.types import compare_dict_structure, generate_dumper, generate_loader
 
 
-@dataclass
+@dataclass(slots=True)
 class License:
     """Dataclass that mimics License structure of COCO dataset."""
     id: int
     name: str = ""
     url: str = ""
 
+    _load: ClassVar[Callable[[Dict[str, Any]], 'License']]
+    to_dict: ClassVar[Callable[['License'], Dict[str, Any]]]
+
     @classmethod
     def from_dict(cls, license_dict: Dict[str, Any], ignore_extra_keys = True):
         """Generates License dataclass from dictionary.
@@ -23,4 +26,8 @@ class License:
             License: Object generated from dictionary.
         """
         compare_dict_structure(license_dict, cls, ignore_extra_keys)
-        return cls(**license_dict)
+        return cls._load(license_dict)
+
+
+License._load = staticmethod(generate_loader(License))
+License.to_dict = generate_dumper(License)
@@ -0,0 +1,131 @@
+from array import array
+from typing import List, Union
+
+import msgspec
+
+from structures.annotation import RLE, ObjectDetectionPolygonAnnotation, ObjectDetectionRLEAnnotation
+from structures.category import ObjectDetectionCategory
+from structures.coco import COCO
+from structures.image import Image
+from structures.info import Info
+from structures.license import License
+
+
+class InfoStruct(msgspec.Struct, gc=False):
+    """Struct that mirrors `Info` dataclass for `msgspec` decoding."""
+    year: int
+    version: str
+    description: str
+    contributor: str
+    url: str
+    date_created: str
+
+    def to_dataclass(self) -> Info:
+        return Info(self.year, self.version, self.description, self.contributor, self.url, self.date_created)
+
+
+class LicenseStruct(msgspec.Struct, gc=False):
+    """Struct that mirrors `License` dataclass for `msgspec` decoding."""
+    id: int
+    name: str
+    url: str
+
+    def to_dataclass(self) -> License:
+        return License(self.id, self.name, self.url)
+
+
+class ImageStruct(msgspec.Struct, gc=False):
+    """Struct that mirrors `Image` dataclass for `msgspec` decoding."""
+    id: int
+    width: int
+    height: int
+    file_name: str
+    license: int
+    flickr_url: str
+    coco_url: str
+    date_captured: str
+
+    def to_dataclass(self) -> Image:
+        return Image(
+            self.id, self.width, self.height, self.file_name,
+            self.license, self.flickr_url, self.coco_url, self.date_captured
+        )
+
+
+class ObjectDetectionCategoryStruct(msgspec.Struct, gc=False):
+    """Struct that mirrors `ObjectDetectionCategory` dataclass for `msgspec` decoding."""
+    id: int
+    name: str
+    supercategory: str
+
+    def to_dataclass(self) -> ObjectDetectionCategory:
+        return ObjectDetectionCategory(self.id, self.name, self.supercategory)
+
+
+class RLEStruct(msgspec.Struct, gc=False):
+    """Struct that mirrors `RLE` dataclass for `msgspec` decoding."""
+    counts: Union[List[int], str]
+    size: List[int]
+
+    def to_dataclass(self) -> RLE:
+        return RLE(self.counts, self.size)
+
+
+class ObjectDetectionAnnotationStruct(msgspec.Struct, gc=False):
+    """Struct that mirrors `ObjectDetectionAnnotation` dataclass for `msgspec` decoding."""
+    id: int
+    image_id: int
+    category_id: int
+    segmentation: Union[List[List[float]], RLEStruct]
+    area: float
+    bbox: List[float]
+    iscrowd: int
+
+    def to_dataclass(self) -> Union[ObjectDetectionPolygonAnnotation, ObjectDetectionRLEAnnotation]:
+        if isinstance(self.segmentation, RLEStruct):
+            return ObjectDetectionRLEAnnotation(
+                self.id, self.image_id, self.category_id,
+                self.segmentation.to_dataclass(), self.area, array('d', self.bbox), self.iscrowd
+            )
+        return ObjectDetectionPolygonAnnotation(
+            self.id, self.image_id, self.category_id,
+            self.segmentation, self.area, array('d', self.bbox), self.iscrowd
+        )
+
+
+class COCOStruct(msgspec.Struct, gc=False):
+    """Struct that mirrors Object Detection `COCO` dataset for `msgspec` decoding."""
+    info: InfoStruct
+    licenses: List[LicenseStruct]
+    categories: List[ObjectDetectionCategoryStruct]
+    images: List[ImageStruct]
+    annotations: List[ObjectDetectionAnnotationStruct]
+
+    def to_dataclass(self) -> COCO:
+        return COCO(
+            info = self.info.to_dataclass(),
+            licenses = [license.to_dataclass() for license in self.licenses],
+            categories = [category.to_dataclass() for category in self.categories],
+            images = [image.to_dataclass() for image in self.images],
+            annotations = [annotation.to_dataclass() for annotation in self.annotations],
+        )
+
+
+def load_coco(path_to_json: str) -> COCO:
+    """Generates Object Detection COCO dataset from json file using `msgspec` decoder.
+    JSON is decoded straight into typed structs without intermediate dictionaries and validation in Python,
+    which is considerably faster than `COCO.from_json` on large datasets. Requires `msgspec` to be installed.
+    Every key required by `COCO.from_json` is required by the structs as well, extra keys are ignored.
+
+    Args:
+        path_to_json (str): path where COCO JSON dataset is located.
+
+    Raises:
+        msgspec.ValidationError: If JSON does not follow Object Detection COCO dataset structure.
+
+    Returns:
+        COCO: COCO dataset generated from JSON file.
+    """
+    with open(path_to_json, 'rb') as f:
+        dataset = msgspec.json.decode(f.read(), type=COCOStruct)
+    return dataset.to_dataclass()
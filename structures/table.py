@@ -0,0 +1,330 @@
+from array import array
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Union
+
+from structures.annotation import RLE, ObjectDetectionAnnotation, SegmentInfo
+from structures.image import Image
+
+
+def stack_bboxes(annotations: Iterable[Any], typecode: str = 'd') -> array:
+    """Stacks bounding boxes of the annotations into one flat typed array, 4 values per annotation.
+
+    Args:
+        annotations (Iterable[Any]): Annotations that have `bbox` field.
+        typecode (str, optional): Typecode of the array, integer boxes of Segment Infos use `'q'`. Defaults to `'d'`.
+
+    Returns:
+        array: Contiguous array of `x, y, width, height` values of every bounding box.
+    """
+    bboxes = array(typecode)
+    for annotation in annotations:
+        bboxes.extend(annotation.bbox)
+    return bboxes
+
+
+def indices_of(values: array, value: int) -> List[int]:
+    """Indices of all elements of the typed array that are equal to `value`.
+    Search between matches is done by `array.index` in C, instead of comparing elements one by one in Python.
+
+    Args:
+        values (array): Typed array to search in.
+        value (int): Value to search for.
+
+    Returns:
+        List[int]: Ascending indices of the matching elements.
+    """
+    indices: List[int] = []
+    index = -1
+    try:
+        while True:
+            index = values.index(value, index + 1)
+            indices.append(index)
+    except ValueError:
+        return indices
+
+
+@dataclass(slots=True)
+class AnnotationTable:
+    """Struct of arrays storage for Object Detection Annotations of COCO dataset.
+    Numeric fields are kept in contiguous typed arrays instead of separate Python objects,
+    `ObjectDetectionAnnotation` objects are generated only when accessed by index.
+    """
+    ids: array = field(default_factory=partial(array, 'q'))
+    image_ids: array = field(default_factory=partial(array, 'q'))
+    category_ids: array = field(default_factory=partial(array, 'q'))
+    areas: array = field(default_factory=partial(array, 'd'))
+    bboxes: array = field(default_factory=partial(array, 'd'))
+    iscrowds: array = field(default_factory=partial(array, 'b'))
+    segmentations: List[Union[List[List[float]], RLE]] = field(default_factory=list)
+
+    @classmethod
+    def from_dicts(cls, annotation_dicts: List[Dict[str, Any]], ignore_extra_keys = True):
+        """Generates Annotation Table straight from list of dictionaries, without intermediate `ObjectDetectionAnnotation` objects.
+
+        Args:
+            annotation_dicts (List[Dict[str, Any]]): Dictionary objects that have COCO Object Detection Annotation structure.
+            ignore_extra_keys (bool, optional): Ignore the fact dictionary has more fields than specified in dataset. Defaults to True.
+
+        Returns:
+            AnnotationTable: Table generated from dictionaries.
+        """
+        if annotation_dicts:
+            ObjectDetectionAnnotation.from_dict(annotation_dicts[0], ignore_extra_keys)
+        bboxes = array('d')
+        segmentations: List[Union[List[List[float]], RLE]] = list()
+        for annotation_dict in annotation_dicts:
+            bboxes.extend(annotation_dict['bbox'])
+            segmentation = annotation_dict['segmentation']
+            segmentations.append(RLE._load(segmentation) if type(segmentation) is dict else segmentation)
+        return cls(
+            ids = array('q', [annotation_dict['id'] for annotation_dict in annotation_dicts]),
+            image_ids = array('q', [annotation_dict['image_id'] for annotation_dict in annotation_dicts]),
+            category_ids = array('q', [annotation_dict['category_id'] for annotation_dict in annotation_dicts]),
+            areas = array('d', [annotation_dict['area'] for annotation_dict in annotation_dicts]),
+            bboxes = bboxes,
+            iscrowds = array('b', [annotation_dict['iscrowd'] for annotation_dict in annotation_dicts]),
+            segmentations = segmentations,
+        )
+
+    @classmethod
+    def from_annotations(cls, annotations: List[ObjectDetectionAnnotation]):
+        """Generates Annotation Table from list of Object Detection Annotations.
+
+        Args:
+            annotations (List[ObjectDetectionAnnotation]): Annotations that will be stored in the table.
+
+        Returns:
+            AnnotationTable: Table generated from annotations.
+        """
+        return cls(
+            ids = array('q', [annotation.id for annotation in annotations]),
+            image_ids = array('q', [annotation.image_id for annotation in annotations]),
+            category_ids = array('q', [annotation.category_id for annotation in annotations]),
+            areas = array('d', [annotation.area for annotation in annotations]),
+            bboxes = stack_bboxes(annotations),
+            iscrowds = array('b', [annotation.iscrowd for annotation in annotations]),
+            segmentations = [annotation.segmentation for annotation in annotations],
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> ObjectDetectionAnnotation:
+        index = range(len(self.ids))[index]
+        return ObjectDetectionAnnotation(
+            self.ids[index],
+            self.image_ids[index],
+            self.category_ids[index],
+            self.segmentations[index],
+            self.areas[index],
+            self.bboxes[4 * index:4 * index + 4],
+            self.iscrowds[index],
+        )
+
+    def __iter__(self) -> Iterator[ObjectDetectionAnnotation]:
+        return (self[index] for index in range(len(self.ids)))
+
+    def filter_by_image_id(self, image_id: int) -> List[int]:
+        """List of indices of annotations that belong to the image with given id."""
+        return indices_of(self.image_ids, image_id)
+
+    def filter_by_category_id(self, category_id: int) -> List[int]:
+        """List of indices of annotations that belong to the category with given id."""
+        return indices_of(self.category_ids, category_id)
+
+    def group_by_image_id(self) -> Dict[int, List[int]]:
+        """Indices of annotations grouped by image id in one pass over the table."""
+        groups: Dict[int, List[int]] = dict()
+        for index, image_id in enumerate(self.image_ids):
+            groups.setdefault(image_id, []).append(index)
+        return groups
+
+
+@dataclass(slots=True)
+class SegmentInfoArray:
+    """Struct of arrays storage for Segment Infos of one Panoptic Segmentation Annotation.
+    All segments of the image are kept in contiguous typed arrays,
+    `SegmentInfo` objects are generated only when accessed by index.
+    """
+    ids: array = field(default_factory=partial(array, 'q'))
+    category_ids: array = field(default_factory=partial(array, 'q'))
+    areas: array = field(default_factory=partial(array, 'q'))
+    bboxes: array = field(default_factory=partial(array, 'q'))
+    iscrowds: array = field(default_factory=partial(array, 'b'))
+
+    @classmethod
+    def from_dicts(cls, segment_info_dicts: List[Dict[str, Any]], ignore_extra_keys = True):
+        """Generates Segment Info Array straight from list of dictionaries, without intermediate `SegmentInfo` objects.
+
+        Args:
+            segment_info_dicts (List[Dict[str, Any]]): Dictionary objects that have COCO Segment Info structure.
+            ignore_extra_keys (bool, optional): Ignore the fact dictionary has more fields than specified in dataset. Defaults to True.
+
+        Returns:
+            SegmentInfoArray: Array generated from dictionaries.
+        """
+        if segment_info_dicts:
+            SegmentInfo.from_dict(segment_info_dicts[0], ignore_extra_keys)
+        bboxes = array('q')
+        for segment_info_dict in segment_info_dicts:
+            bboxes.extend(segment_info_dict['bbox'])
+        return cls(
+            ids = array('q', [segment_info_dict['id'] for segment_info_dict in segment_info_dicts]),
+            category_ids = array('q', [segment_info_dict['category_id'] for segment_info_dict in segment_info_dicts]),
+            areas = array('q', [segment_info_dict['area'] for segment_info_dict in segment_info_dicts]),
+            bboxes = bboxes,
+            iscrowds = array('b', [segment_info_dict['iscrowd'] for segment_info_dict in segment_info_dicts]),
+        )
+
+    @classmethod
+    def from_segments_info(cls, segments_info: List[SegmentInfo]):
+        """Generates Segment Info Array from list of Segment Infos.
+
+        Args:
+            segments_info (List[SegmentInfo]): Segment Infos that will be stored in the array.
+
+        Returns:
+            SegmentInfoArray: Array generated from Segment Infos.
+        """
+        return cls(
+            ids = array('q', [segment_info.id for segment_info in segments_info]),
+            category_ids = array('q', [segment_info.category_id for segment_info in segments_info]),
+            areas = array('q', [segment_info.area for segment_info in segments_info]),
+            bboxes = stack_bboxes(segments_info, 'q'),
+            iscrowds = array('b', [segment_info.iscrowd for segment_info in segments_info]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> SegmentInfo:
+        index = range(len(self.ids))[index]
+        return SegmentInfo(
+            self.ids[index],
+            self.category_ids[index],
+            self.areas[index],
+            self.bboxes[4 * index:4 * index + 4].tolist(),
+            self.iscrowds[index],
+        )
+
+    def __iter__(self) -> Iterator[SegmentInfo]:
+        return (self[index] for index in range(len(self.ids)))
+
+    def filter_by_category_id(self, category_id: int) -> List[int]:
+        """List of indices of segments that belong to the category with given id."""
+        return indices_of(self.category_ids, category_id)
+
+
+@dataclass(slots=True)
+class ImageTable:
+    """Struct of arrays storage for Images of COCO dataset.
+    Numeric fields are kept in contiguous typed arrays and string fields in plain lists,
+    `Image` objects are generated only when accessed by index.
+    """
+    ids: array = field(default_factory=partial(array, 'q'))
+    widths: array = field(default_factory=partial(array, 'q'))
+    heights: array = field(default_factory=partial(array, 'q'))
+    licenses: array = field(default_factory=partial(array, 'q'))
+    file_names: List[str] = field(default_factory=list)
+    flickr_urls: List[str] = field(default_factory=list)
+    coco_urls: List[str] = field(default_factory=list)
+    dates_captured: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dicts(cls, image_dicts: List[Dict[str, Any]], ignore_extra_keys = True):
+        """Generates Image Table straight from list of dictionaries, without intermediate `Image` objects.
+
+        Args:
+            image_dicts (List[Dict[str, Any]]): Dictionary objects that have COCO Image structure.
+            ignore_extra_keys (bool, optional): Ignore the fact dictionary has more fields than specified in dataset. Defaults to True.
+
+        Returns:
+            ImageTable: Table generated from dictionaries.
+        """
+        if image_dicts:
+            Image.from_dict(image_dicts[0], ignore_extra_keys)
+        return cls(
+            ids = array('q', [image_dict['id'] for image_dict in image_dicts]),
+            widths = array('q', [image_dict['width'] for image_dict in image_dicts]),
+            heights = array('q', [image_dict['height'] for image_dict in image_dicts]),
+            licenses = array('q', [image_dict['license'] for image_dict in image_dicts]),
+            file_names = [image_dict['file_name'] for image_dict in image_dicts],
+            flickr_urls = [image_dict['flickr_url'] for image_dict in image_dicts],
+            coco_urls = [image_dict['coco_url'] for image_dict in image_dicts],
+            dates_captured = [image_dict['date_captured'] for image_dict in image_dicts],
+        )
+
+    @classmethod
+    def from_images(cls, images: List[Image]):
+        """Generates Image Table from list of Images.
+
+        Args:
+            images (List[Image]): Images that will be stored in the table.
+
+        Returns:
+            ImageTable: Table generated from images.
+        """
+        return cls(
+            ids = array('q', [image.id for image in images]),
+            widths = array('q', [image.width for image in images]),
+            heights = array('q', [image.height for image in images]),
+            licenses = array('q', [image.license for image in images]),
+            file_names = [image.file_name for image in images],
+            flickr_urls = [image.flickr_url for image in images],
+            coco_urls = [image.coco_url for image in images],
+            dates_captured = [image.date_captured for image in images],
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> Image:
+        index = range(len(self.ids))[index]
+        return Image(
+            self.ids[index],
+            self.widths[index],
+            self.heights[index],
+            self.file_names[index],
+            self.licenses[index],
+            self.flickr_urls[index],
+            self.coco_urls[index],
+            self.dates_captured[index],
+        )
+
+    def __iter__(self) -> Iterator[Image]:
+        return (self[index] for index in range(len(self.ids)))
+
+    def filter_by_license(self, license_id: int) -> List[int]:
+        """List of indices of images that have license with given id."""
+        return indices_of(self.licenses, license_id)
+
+    def select(self, indices: Iterable[int]) -> 'ImageTable':
+        """New table with rows at the given indices, in the order of indices."""
+        indices = list(indices)
+        return ImageTable(
+            ids = array('q', [self.ids[index] for index in indices]),
+            widths = array('q', [self.widths[index] for index in indices]),
+            heights = array('q', [self.heights[index] for index in indices]),
+            licenses = array('q', [self.licenses[index] for index in indices]),
+            file_names = [self.file_names[index] for index in indices],
+            flickr_urls = [self.flickr_urls[index] for index in indices],
+            coco_urls = [self.coco_urls[index] for index in indices],
+            dates_captured = [self.dates_captured[index] for index in indices],
+        )
+
+    def trim(self, image_ids: Collection[int], license_ids: Collection[int]) -> 'ImageTable':
+        """New table with images which ids are in `image_ids` and licenses are in `license_ids`, same as `COCO.trim_images`.
+
+        Args:
+            image_ids (Collection[int]): Ids of images that are used, e.g. by annotations. Should be a set for fast lookups.
+            license_ids (Collection[int]): Ids of licenses present in the dataset. Should be a set for fast lookups.
+
+        Returns:
+            ImageTable: Table with only the used images.
+        """
+        return self.select(
+            index
+            for index, (image_id, license_id) in enumerate(zip(self.ids, self.licenses))
+            if image_id in image_ids and license_id in license_ids
+        )
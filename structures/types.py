@@ -1,6 +1,8 @@
 
-from typing import List, Tuple, TypeVar, Any, Dict, Protocol, Union, runtime_checkable
-from dataclasses import fields
+from typing import Callable, FrozenSet, Iterable, List, Optional, Tuple, TypeVar, Any, Dict, Protocol, Union, runtime_checkable
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from itertools import islice
 
 T = TypeVar('T')
 
@@ -23,8 +25,18 @@ class Categorized(Protocol):
     category_id: int
 
 
+POOL_SIZE = 1024
+
+
+@lru_cache(maxsize=None)
+def _field_names(obj: Any) -> FrozenSet[str]:
+    """Names of the dataclass fields that are passed to its constructor, computed once per dataclass."""
+    return frozenset(field.name for field in fields(obj) if field.init)
+
+
 def compare_dict_structure(dictionatry: Dict[str, Any], obj: Any, ignore_extra_keys = True):
     """Compares if dictionary follows the structure of the dataclass.
+    Keys are compared as set views of the dictionary, so dictionaries that follow the structure are checked without allocations.
 
     Args:
         dictionatry (Dict[str, Any]): Dictionary which structure will be compared
@@ -35,8 +47,13 @@ def compare_dict_structure(dictionatry: Dict[str, Any], obj: Any, ignore_extra_k
         ValueError: If dictionary is missing some fields
         ValueError: If dictionary has extraf fields, will be raised only if `ignore_extra_keys` is False.
     """
-    missed_keys = {field.name for field in fields(obj)}.difference(dictionatry.keys())
-    extra_keys = set(dictionatry.keys()).difference(field.name for field in fields(obj))
+    names = _field_names(obj)
+    keys = dictionatry.keys()
+    if keys >= names if ignore_extra_keys else keys == names:
+        return
+
+    missed_keys = names - keys
+    extra_keys = keys - names
 
     if missed_keys:
         raise ValueError(
@@ -52,9 +69,174 @@ def compare_dict_structure(dictionatry: Dict[str, Any], obj: Any, ignore_extra_k
         )
 
 
+def release_to_pool(pool: List[Any], instances: Iterable[Any]):
+    """Puts instances that are no longer used into the free-list of the loader, until it reaches `POOL_SIZE`.
+    Released instances are reused by the next loaded objects, so they should not be referenced anywhere else.
+
+    Args:
+        pool (List[Any]): Free-list of the dataclass passed to `generate_loader`.
+        instances (Iterable[Any]): Instances of the dataclass that will be reused.
+    """
+    for instance in instances:
+        if len(pool) >= POOL_SIZE:
+            break
+        pool.append(instance)
+
+
+def generate_loader(
+    obj: Any, pool: Optional[List[Any]] = None, **converters: Callable[[Any], Any]
+) -> Callable[[Dict[str, Any]], Any]:
+    """Generates function that constructs the dataclass from dictionary without any validation.
+    Object is allocated with `object.__new__` and fields are assigned directly, skipping the call of `__init__`,
+    which is noticeably cheaper when called for every annotation. Therefore dataclass should not rely on `__post_init__`.
+
+    If converter is a dataclass itself, its construction is inlined into the generated loader,
+    so nested objects, like `RLE` segmentation, are built without an extra function call.
+
+    Args:
+        obj (Any): dataclass that will be constructed by the loader.
+        pool (List[Any], optional): Free-list of released instances that are reused before allocating new ones. Defaults to None.
+        **converters (Callable[[Any], Any]): Functions applied to the values of the fields with the same name.
+
+    Returns:
+        Callable[[Dict[str, Any]], Any]: Loader that expects dictionary with every field of the dataclass.
+    """
+    namespace: Dict[str, Any] = {'cls': obj, '_new': object.__new__}
+    allocation = '_new(cls)'
+    if pool is not None:
+        namespace['_pool'] = pool
+        allocation = '_pool.pop() if _pool else _new(cls)'
+    assignments = []
+    for field in fields(obj):
+        value = f'd[{field.name!r}]'
+        converter = converters.get(field.name)
+        if isinstance(converter, type) and is_dataclass(converter):
+            namespace[f'_cls_{field.name}'] = converter
+            nested_allocation = f'_new(_cls_{field.name})'
+            if isinstance(getattr(converter, '_pool', None), list):
+                namespace[f'_pool_{field.name}'] = converter._pool
+                nested_allocation = f'_pool_{field.name}.pop() if _pool_{field.name} else {nested_allocation}'
+            assignments.append(f'        _d_{field.name} = {value}\n')
+            assignments.append(f'        _{field.name} = {nested_allocation}\n')
+            for nested_field in fields(converter):
+                assignments.append(f'        _{field.name}.{nested_field.name} = _d_{field.name}[{nested_field.name!r}]\n')
+            value = f'_{field.name}'
+        elif converter is not None:
+            namespace[f'_convert_{field.name}'] = converter
+            value = f'_convert_{field.name}({value})'
+        assignments.append(f'        instance.{field.name} = {value}\n')
+
+    source = (
+        f"def _make_loader({', '.join(namespace)}):\n"
+        f"    def _load(d):\n"
+        f"        instance = {allocation}\n"
+        f"{''.join(assignments)}"
+        f"        return instance\n"
+        f"    return _load"
+    )
+    local: Dict[str, Any] = {}
+    exec(source, {}, local)
+    return local['_make_loader'](**namespace)
+
+
+def generate_dumper(obj: Any, **converters: Callable[[Any], Any]) -> Callable[[Any], Dict[str, Any]]:
+    """Generates function that transforms the dataclass into dictionary of its fields.
+    Unlike `dataclasses.asdict` values are not deep copied, only converted fields, such as nested dataclasses, are transformed.
+
+    Args:
+        obj (Any): dataclass that will be transformed by the dumper.
+        **converters (Callable[[Any], Any]): Functions applied to the values of the fields with the same name.
+
+    Returns:
+        Callable[[Any], Dict[str, Any]]: Dumper that can be assigned to the dataclass as `to_dict` method.
+    """
+    namespace: Dict[str, Any] = dict()
+    items = []
+    for field in fields(obj):
+        value = f'self.{field.name}'
+        if field.name in converters:
+            namespace[f'_convert_{field.name}'] = converters[field.name]
+            value = f'_convert_{field.name}({value})'
+        items.append(f'            {field.name!r}: {value},\n')
+
+    source = (
+        f"def _make_dumper({', '.join(namespace)}):\n"
+        f"    def to_dict(self):\n"
+        f"        return {{\n"
+        f"{''.join(items)}"
+        f"        }}\n"
+        f"    return to_dict"
+    )
+    local: Dict[str, Any] = {}
+    exec(source, {}, local)
+    to_dict = local['_make_dumper'](**namespace)
+    to_dict.__qualname__ = f'{obj.__qualname__}.to_dict'
+    to_dict.__doc__ = f'Transforms {obj.__name__} dataclass to the Dictionary.'
+    return to_dict
+
+
+def load_dicts(
+    dictionaries: List[Dict[str, Any]], obj: Any, ignore_extra_keys = True,
+    load: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    from_dict: Optional[Callable[[Dict[str, Any], bool], Any]] = None, first: Optional[Any] = None
+) -> List[Any]:
+    """Generates list of dataclasses from list of dictionaries that share the same structure.
+    Only the first dictionary goes through validating `from_dict`, rest that have exactly the same keys
+    are constructed with unchecked `_load`. Dictionaries with other keys are validated by `from_dict` one by one,
+    so extra keys are still reported when `ignore_extra_keys` is False.
+    If some of the dictionaries is missing keys, all of them are validated to raise descriptive error.
+
+    Args:
+        dictionaries (List[Dict[str, Any]]): Dictionaries with the same structure.
+        obj (Any): dataclass with `from_dict` and `_load` methods that will be constructed.
+        ignore_extra_keys (bool, optional): Ignore the fact dictionary has more fields than specified in dataset. Defaults to True.
+        load (Callable[[Dict[str, Any]], Any], optional): Unchecked loader to use instead of `obj._load`. Defaults to None.
+        from_dict (Callable[[Dict[str, Any], bool], Any], optional): Validating constructor to use instead of `obj.from_dict`. Defaults to None.
+        first (Any, optional): Object already generated from the first dictionary by `from_dict`. Defaults to None.
+
+    Raises:
+        ValueError: If dictionaries do not follow the structure of the dataclass.
+
+    Returns:
+        List[Any]: Objects generated from dictionaries.
+    """
+    if not dictionaries:
+        return list()
+
+    if from_dict is None:
+        from_dict = obj.from_dict
+    if load is None:
+        load = obj._load
+    if first is None:
+        first = from_dict(dictionaries[0], ignore_extra_keys)
+
+    keys = dictionaries[0].keys()
+    objects = [first]
+    try:
+        objects.extend(
+            load(dictionary) if dictionary.keys() == keys else from_dict(dictionary, ignore_extra_keys)
+            for dictionary in islice(dictionaries, 1, None)
+        )
+    except (KeyError, TypeError):
+        for dictionary in dictionaries:
+            from_dict(dictionary, ignore_extra_keys)
+        raise
+    return objects
+
+
 def isinstances(__obj: List[Any], __class_or_tuple: Union[Any, Tuple[Any]]) -> bool:
     """Return whether an every element of the list is an instance of a class or of a subclass thereof.
     A tuple, as in `isinstance(x, (A, B, ...))`, may be given as the target to check against.
     This is equivalent to `isinstance(x, A)` or `isinstance(x, B)` or ... etc.
+    Check is done once per concrete class of the elements, which matters for costly runtime checkable Protocols.
+    """
+    samples = {type(obj): obj for obj in __obj}
+    return all(isinstance(obj, __class_or_tuple) for obj in samples.values())
+
+
+def isinstances_sampled(__obj: List[Any], __class_or_tuple: Union[Any, Tuple[Any]]) -> bool:
+    """Cheap version of `isinstances`, that checks only the first and the last elements of the list.
+    Lists of dataset items are expected to be homogeneous, so walking entire list is not required to pick the right branch.
+    Empty list passes the check, same as with `isinstances`.
     """
-    return all(isinstance(obj, __class_or_tuple) for obj in __obj)
\ No newline at end of file
+    return not __obj or (isinstance(__obj[0], __class_or_tuple) and isinstance(__obj[-1], __class_or_tuple))
@@ -0,0 +1,113 @@
+import json
+import os
+import tempfile
+import unittest
+
+from array import array
+
+from structures import Image, Info, License
+from structures.annotation import (
+    RLE, DensePoseAnnotation, ObjectDetectionAnnotation, ObjectDetectionPolygonAnnotation,
+    PanopticSegmentationAnnotation, SegmentInfo
+)
+from structures.category import ObjectDetectionCategory
+from structures.coco import COCO
+from structures.table import AnnotationTable
+
+
+class TestConstructedToDict(unittest.TestCase):
+    """Dataclasses constructed by hand may hold plain lists where loaded ones hold typed arrays."""
+
+    def test_object_detection_with_list_bbox(self):
+        annotation = ObjectDetectionAnnotation(1, 1, 1, [[0, 0, 1, 1]], 1.0, [1., 2., 3., 4.], 0)
+        self.assertEqual(annotation.to_dict()['bbox'], [1., 2., 3., 4.])
+        json.dumps(annotation.to_dict())
+
+    def test_object_detection_with_array_bbox(self):
+        annotation = ObjectDetectionAnnotation(1, 1, 1, [[0, 0, 1, 1]], 1.0, array('d', [1., 2., 3., 4.]), 0)
+        self.assertEqual(annotation.to_dict()['bbox'], [1., 2., 3., 4.])
+        json.dumps(annotation.to_dict())
+
+    def test_dense_pose_with_lists(self):
+        annotation = DensePoseAnnotation(
+            1, 1, 1, 0, 10, [1, 2, 3, 4], [1.], [0.5], [0.5], [2.], [3.], [RLE([1, 2], [1, 3])]
+        )
+        dictionary = annotation.to_dict()
+        self.assertEqual(dictionary['dp_I'], [1.])
+        self.assertEqual(dictionary['dp_masks'], [{'counts': [1, 2], 'size': [1, 3]}])
+        json.dumps(dictionary)
+
+    def test_table_annotation(self):
+        table = AnnotationTable.from_annotations([
+            ObjectDetectionPolygonAnnotation(1, 1, 1, [[0, 0, 1, 1]], 1.0, [1., 2., 3., 4.], 0)
+        ])
+        self.assertIsInstance(table[0].bbox, array)
+        self.assertEqual(table[0].to_dict()['bbox'], [1., 2., 3., 4.])
+
+    def test_to_json_of_constructed_dataset(self):
+        coco = COCO(
+            info = Info(2017, '1.0', 'description', 'contributor', 'url', '2017-01-01'),
+            licenses = [License(1, 'license', 'url')],
+            categories = [ObjectDetectionCategory(1, 'person', 'person')],
+            images = [Image(1, 2, 2, 'image.jpg', 1, '', '', '')],
+            annotations = [ObjectDetectionPolygonAnnotation(1, 1, 1, [[0, 0, 1, 1]], 1.0, [1., 2., 3., 4.], 0)],
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'coco.json')
+            coco.to_json(path)
+            self.assertEqual(COCO.from_json(path).to_dict(), coco.to_dict())
+
+
+class TestRLEToMask(unittest.TestCase):
+
+    def test_plain_counts(self):
+        # 3x3 mask flattened by columns: first column is 0, 0, 1, second 1, 1, 0, third is empty.
+        self.assertEqual(RLE([2, 3, 4], [3, 3]).to_mask(), bytes([0, 0, 1, 1, 1, 0, 0, 0, 0]))
+
+    def test_compressed_counts(self):
+        # 'T33b1N' is compressed form of [100, 3, 50, 1], later counts are stored as differences.
+        mask = RLE('T33b1N', [11, 14]).to_mask()
+        self.assertEqual(mask, bytes(100) + b'\x01' * 3 + bytes(50) + b'\x01')
+        self.assertEqual(len(mask), 11 * 14)
+
+    def test_compressed_same_as_plain(self):
+        self.assertEqual(RLE('051S11', [6, 8]).to_mask(), RLE([0, 5, 1, 40, 2], [6, 8]).to_mask())
+
+
+class TestLazySegmentsInfo(unittest.TestCase):
+
+    def setUp(self):
+        self.annotation = PanopticSegmentationAnnotation.from_dict({
+            'image_id': 1, 'file_name': 'panoptic.png', 'segments_info': [
+                {'id': id, 'category_id': id, 'area': 1, 'bbox': [1, 2, 3, 4], 'iscrowd': 0} for id in (1, 2, 3)
+            ]
+        })
+
+    def test_reads_without_generating(self):
+        self.assertEqual(self.annotation.category_ids, [1, 2, 3])
+        self.assertEqual(self.annotation.segments_info[1], SegmentInfo(2, 2, 1, [1, 2, 3, 4], 0))
+
+    def test_modifies_as_list(self):
+        segments_info = self.annotation.segments_info
+        segments_info.append(SegmentInfo(4, 4))
+        segments_info[0] = SegmentInfo(5, 5)
+        del segments_info[1]
+        self.assertEqual([segment_info.id for segment_info in segments_info], [5, 3, 4])
+        self.assertEqual(self.annotation.category_ids, [5, 3, 4])
+        self.assertEqual(self.annotation.to_dict()['segments_info'][-1]['id'], 4)
+
+    def test_malformed_segment_is_reported_at_load(self):
+        segment_info = {'id': 1, 'category_id': 1, 'area': 1, 'bbox': [1, 2, 3, 4], 'iscrowd': 0}
+        malformed = {'id': 2, 'area': 1, 'bbox': [1, 2, 3, 4], 'iscrowd': 0}
+        annotation_dicts = [
+            {'image_id': 1, 'file_name': '1.png', 'segments_info': [segment_info]},
+            {'image_id': 2, 'file_name': '2.png', 'segments_info': [segment_info, malformed]},
+        ]
+        with self.assertRaises(ValueError):
+            PanopticSegmentationAnnotation.from_dicts(annotation_dicts)
+        with self.assertRaises(ValueError):
+            PanopticSegmentationAnnotation.from_dict(annotation_dicts[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
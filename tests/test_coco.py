@@ -0,0 +1,279 @@
+import json
+import os
+import tempfile
+import unittest
+
+from copy import deepcopy
+from dataclasses import fields
+from typing import Any, Callable, Dict, List
+
+from structures import Image, License
+from structures.annotation import ImageCaptioningAnnotation, KeypointDetectionAnnotation, ObjectDetectionPolygonAnnotation
+from structures.category import ObjectDetectionCategory
+from structures.coco import COCO
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def object_detection_dict(id: int, image_id: int, category_id: int, **extra: Any) -> Dict[str, Any]:
+    return dict({
+        'id': id, 'image_id': image_id, 'category_id': category_id, 'segmentation': [[0.0, 0.0, 1.0, 1.0]],
+        'area': 1.0, 'bbox': [0.0, 0.0, 1.0, 1.0], 'iscrowd': 0
+    }, **extra)
+
+
+def coco_dict(annotations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        'info': {
+            'year': 2017, 'version': '1.0', 'description': 'description', 'contributor': 'contributor',
+            'url': 'url', 'date_created': '2017-01-01'
+        },
+        'licenses': [{'id': 1, 'name': 'license', 'url': 'url'}],
+        'categories': [
+            {'id': 1, 'name': 'person', 'supercategory': 'person'},
+            {'id': 2, 'name': 'bicycle', 'supercategory': 'vehicle'},
+        ],
+        'images': [
+            {
+                'id': id, 'width': 2, 'height': 2, 'file_name': f'{id}.jpg', 'license': 1,
+                'flickr_url': '', 'coco_url': '', 'date_captured': ''
+            } for id in (1, 2, 3)
+        ],
+        'annotations': annotations,
+    }
+
+
+class JSONFileTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write_json(self, dictionary: Dict[str, Any]) -> str:
+        path = os.path.join(self.directory.name, 'coco.json')
+        with open(path, 'w') as json_file:
+            json.dump(dictionary, json_file)
+        return path
+
+
+def messy_coco() -> COCO:
+    """Dataset with gaps in ids, unused items and annotations of missing images."""
+    dictionary = coco_dict([object_detection_dict(id, id % 5 + 1, id % 3 + 1) for id in range(2, 40, 3)])
+    dictionary['licenses'].append({'id': 7, 'name': 'unused', 'url': 'url'})
+    dictionary['categories'].append({'id': 3, 'name': 'car', 'supercategory': 'vehicle'})
+    dictionary['categories'].append({'id': 9, 'name': 'unused', 'supercategory': 'unused'})
+    dictionary['images'].append({
+        'id': 8, 'width': 2, 'height': 2, 'file_name': '8.jpg', 'license': 7,
+        'flickr_url': '', 'coco_url': '', 'date_captured': ''
+    })
+    return COCO.from_dict(dictionary)
+
+
+def snapshot_indexes(coco: COCO) -> Dict[str, Any]:
+    """Lookup indexes of the dataset with items replaced by their identities."""
+    snapshot = dict()
+    for field in fields(coco):
+        if field.init or field.name == '_next_ids':
+            continue
+        snapshot[field.name] = {
+            key: [id(item) for item in value] if isinstance(value, list) else id(value)
+            for key, value in getattr(coco, field.name).items()
+        }
+    return snapshot
+
+
+class TestIndexes(unittest.TestCase):
+    """Indexes updated by every method should be the same as built from scratch by `rebuild_indexes`."""
+
+    MUTATORS: Dict[str, Callable[[COCO], Any]] = {
+        'append_license': lambda coco: coco.append_license(License(coco.get_new_license_id(), 'new', 'url')),
+        'extend_licenses': lambda coco: coco.extend_licenses([License(10, 'a', 'url'), License(11, 'b', 'url')]),
+        'append_category': lambda coco: coco.append_category(ObjectDetectionCategory(10, 'new', 'person')),
+        'extend_categories': lambda coco: coco.extend_categories([
+            ObjectDetectionCategory(10, 'a', 'person'), ObjectDetectionCategory(11, 'b', 'new')
+        ]),
+        'append_image': lambda coco: coco.append_image(Image(10, 2, 2, '10.jpg', 1, '', '', '')),
+        'extend_images': lambda coco: coco.extend_images([
+            Image(10, 2, 2, '10.jpg', 1, '', '', ''), Image(11, 2, 2, '11.jpg', 7, '', '', '')
+        ]),
+        'append_annotation': lambda coco: coco.append_annotation(
+            ObjectDetectionPolygonAnnotation(100, 1, 2, [[0.0, 0.0, 1.0, 1.0]], 1.0, [0.0, 0.0, 1.0, 1.0], 0)
+        ),
+        'extend_annotations': lambda coco: coco.extend_annotations([
+            ObjectDetectionPolygonAnnotation(id, 2, 1, [[0.0, 0.0, 1.0, 1.0]], 1.0, [0.0, 0.0, 1.0, 1.0], 0)
+            for id in (100, 101)
+        ]),
+        'remove_license': lambda coco: coco.remove_license(coco.licenses[0]),
+        'remove_licenses': lambda coco: coco.remove_licenses(coco.licenses[:1]),
+        'remove_category': lambda coco: coco.remove_category(coco.categories[0]),
+        'remove_categories': lambda coco: coco.remove_categories(coco.categories[1:3]),
+        'remove_image': lambda coco: coco.remove_image(coco.images[1]),
+        'remove_images': lambda coco: coco.remove_images(coco.images[::2]),
+        'remove_annotation': lambda coco: coco.remove_annotation(coco.annotations[3]),
+        'remove_annotations': lambda coco: coco.remove_annotations(coco.annotations[::2]),
+        'trim_dataset': lambda coco: coco.trim_dataset(),
+        'clean_dataset': lambda coco: coco.clean_dataset(),
+        'reindex_dataset': lambda coco: coco.reindex_dataset(),
+        'reindex_license': lambda coco: coco.reindex_license(coco.licenses[0], 20),
+        'reindex_category': lambda coco: coco.reindex_category(coco.categories[1], 20),
+        'reindex_image': lambda coco: coco.reindex_image(coco.images[0], 20),
+        'reindex_annotation': lambda coco: coco.reindex_annotation(coco.annotations[0], 200),
+        'combine': lambda coco: coco.combine(messy_coco()),
+    }
+
+    def test_mutators(self):
+        for name, mutate in self.MUTATORS.items():
+            with self.subTest(method=name):
+                coco = messy_coco()
+                mutate(coco)
+                indexes = snapshot_indexes(coco)
+                coco.rebuild_indexes()
+                self.assertEqual(indexes, snapshot_indexes(coco))
+
+    def test_split(self):
+        for deep_copy in (True, False):
+            with self.subTest(deep_copy=deep_copy):
+                coco = messy_coco()
+                indexes = snapshot_indexes(coco)
+                for part in coco.split(0.5, deep_copy=deep_copy):
+                    part.clean_dataset()
+                coco.rebuild_indexes()
+                self.assertEqual(indexes, snapshot_indexes(coco))
+
+
+class TestCombine(unittest.TestCase):
+
+    def test_combine_with_itself(self):
+        for take_ownership in (False, True):
+            with self.subTest(take_ownership=take_ownership):
+                coco = messy_coco()
+                expected = messy_coco()
+                expected.combine(messy_coco())
+                coco.combine(coco, take_ownership=take_ownership)
+                self.assertEqual(coco.to_dict(), expected.to_dict())
+
+
+class TestCleanDataset(unittest.TestCase):
+
+    def test_same_as_trim_and_reindex(self):
+        coco = messy_coco()
+        expected = deepcopy(coco)
+        coco.clean_dataset()
+        expected.trim_dataset()
+        expected.reindex_dataset()
+        self.assertEqual(coco.to_dict(), expected.to_dict())
+
+
+class TestJSONRoundTrip(unittest.TestCase):
+
+    def test_to_json_from_json(self):
+        coco = messy_coco()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'coco.json')
+            coco.to_json(path)
+            loaded = COCO.from_json(path)
+        self.assertEqual(loaded.to_dict(), coco.to_dict())
+        self.assertEqual(loaded, coco)
+
+    def test_to_dict_is_json_serializable(self):
+        coco = messy_coco()
+        self.assertEqual(json.loads(json.dumps(coco.to_dict())), coco.to_dict())
+
+
+class TestMixedAnnotations(unittest.TestCase):
+    """Captions mixed with object detections should not depend on their position in the list."""
+
+    def coco(self, caption_position: int) -> COCO:
+        annotations = [object_detection_dict(id, 1 + id % 3, 1) for id in range(1, 11)]
+        annotations.insert(caption_position, {'id': 11, 'image_id': 1, 'caption': 'caption'})
+        return COCO.from_dict(coco_dict(annotations))
+
+    def test_get_annotations_by_category(self):
+        for position in (0, 5, 10):
+            with self.subTest(position=position):
+                coco = self.coco(position)
+                self.assertEqual(len(coco.get_annotations_by_category(1)), 10)
+                self.assertEqual(len(coco.get_annotations_by_category('person')), 10)
+                self.assertEqual(len(coco.get_annotations_by_supercategory('person')), 10)
+
+    def test_trim_categories(self):
+        for position in (0, 5, 10):
+            with self.subTest(position=position):
+                coco = self.coco(position)
+                coco.trim_categories()
+                self.assertEqual([category.id for category in coco.categories], [1])
+
+    def test_clean_dataset(self):
+        for position in (0, 5, 10):
+            with self.subTest(position=position):
+                coco = self.coco(position)
+                coco.clean_dataset()
+                self.assertEqual([category.name for category in coco.categories], ['person'])
+
+    def test_categories_of_captions_are_kept(self):
+        coco = COCO.from_dict(coco_dict([{'id': 1, 'image_id': 1, 'caption': 'caption'}]))
+        coco.trim_categories()
+        self.assertEqual(len(coco.categories), 2)
+
+
+class TestRemoveCategories(unittest.TestCase):
+
+    def coco(self) -> COCO:
+        return COCO.from_dict(coco_dict([object_detection_dict(id, 1 + id % 3, 1 + id % 2) for id in range(1, 16)]))
+
+    def test_remove_category_one_by_one(self):
+        coco = self.coco()
+        for category in list(coco.categories):
+            coco.remove_category(category)
+        self.assertEqual(coco.annotations, [])
+
+    def test_remove_categories(self):
+        coco = self.coco()
+        coco.remove_categories(list(coco.categories))
+        self.assertEqual(coco.annotations, [])
+
+
+@unittest.skipUnless(ijson, 'requires ijson')
+class TestFromJSONStreaming(JSONFileTestCase):
+
+    def assertStreamsAsJSON(self, dictionary: Dict[str, Any], ignore_extra_keys = True) -> COCO:
+        path = self.write_json(dictionary)
+        coco = COCO.from_json_streaming(path, ignore_extra_keys)
+        expected = COCO.from_json(path, ignore_extra_keys)
+        self.assertEqual(
+            [type(annotation) for annotation in coco.annotations],
+            [type(annotation) for annotation in expected.annotations]
+        )
+        self.assertEqual(coco.to_dict(), expected.to_dict())
+        return coco
+
+    def test_same_annotations(self):
+        self.assertStreamsAsJSON(coco_dict([object_detection_dict(id, id, 1) for id in (1, 2, 3)]))
+
+    def test_keypoints_after_object_detection(self):
+        coco = self.assertStreamsAsJSON(coco_dict([
+            object_detection_dict(1, 1, 1),
+            object_detection_dict(2, 2, 1, keypoints=[1, 1, 2], num_keypoints=1),
+        ]))
+        self.assertIsInstance(coco.annotations[1], KeypointDetectionAnnotation)
+
+    def test_captions_mixed_with_object_detection(self):
+        coco = self.assertStreamsAsJSON(coco_dict([
+            object_detection_dict(1, 1, 1),
+            {'id': 2, 'image_id': 2, 'caption': 'caption'},
+        ]))
+        self.assertIsInstance(coco.annotations[1], ImageCaptioningAnnotation)
+
+    def test_extra_keys_after_first_annotation(self):
+        path = self.write_json(coco_dict([object_detection_dict(1, 1, 1), object_detection_dict(2, 2, 1, extra=1)]))
+        with self.assertRaises(ValueError):
+            COCO.from_json(path, ignore_extra_keys=False)
+        with self.assertRaises(ValueError):
+            COCO.from_json_streaming(path, ignore_extra_keys=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
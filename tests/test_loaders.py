@@ -0,0 +1,106 @@
+import unittest
+
+from array import array
+
+from structures import Image, Info, License
+from structures.annotation import (
+    RLE, DensePoseAnnotation, ImageCaptioningAnnotation, KeypointDetectionAnnotation, ObjectDetectionAnnotation,
+    ObjectDetectionPolygonAnnotation, ObjectDetectionRLEAnnotation, PanopticSegmentationAnnotation, SegmentInfo,
+    StuffSegmentationAnnotation
+)
+from structures.category import KeypointDetectionCategory, ObjectDetectionCategory, PanopticSegmentationCategory
+
+
+RLE_DICT = {'counts': [2, 3, 4], 'size': [3, 3]}
+SEGMENT_INFO_DICT = {'id': 3, 'category_id': 2, 'area': 10, 'bbox': [1, 2, 3, 4], 'iscrowd': 0}
+POLYGON_DICT = {
+    'id': 1, 'image_id': 2, 'category_id': 3, 'segmentation': [[1.0, 2.0, 3.0, 4.0]],
+    'area': 5.5, 'bbox': [1.0, 2.0, 3.5, 4.5], 'iscrowd': 0
+}
+RLE_ANNOTATION_DICT = dict(POLYGON_DICT, segmentation=RLE_DICT, iscrowd=1)
+KEYPOINT_DICT = dict(POLYGON_DICT, keypoints=[1, 2, 2], num_keypoints=1)
+PANOPTIC_DICT = {'image_id': 2, 'file_name': 'panoptic.png', 'segments_info': [SEGMENT_INFO_DICT, dict(SEGMENT_INFO_DICT, id=4)]}
+CAPTION_DICT = {'id': 1, 'image_id': 2, 'caption': 'caption'}
+DENSE_POSE_DICT = {
+    'id': 1, 'image_id': 2, 'category_id': 3, 'is_crowd': 0, 'area': 10, 'bbox': [1, 2, 3, 4],
+    'dp_I': [1.0, 2.0], 'dp_U': [0.1, 0.2], 'dp_V': [0.3, 0.4], 'dp_x': [5.0, 6.0], 'dp_y': [7.0, 8.0],
+    'dp_masks': [RLE_DICT]
+}
+OBJECT_DETECTION_CATEGORY_DICT = {'id': 1, 'name': 'person', 'supercategory': 'person'}
+KEYPOINT_CATEGORY_DICT = dict(OBJECT_DETECTION_CATEGORY_DICT, keypoints=['nose'], skeleton=[[1, 1]])
+PANOPTIC_CATEGORY_DICT = dict(OBJECT_DETECTION_CATEGORY_DICT, isthing=1, color=[1, 2, 3])
+IMAGE_DICT = {
+    'id': 1, 'width': 640, 'height': 480, 'file_name': 'image.jpg', 'license': 1,
+    'flickr_url': 'flickr', 'coco_url': 'coco', 'date_captured': '2017-01-01'
+}
+INFO_DICT = {
+    'year': 2017, 'version': '1.0', 'description': 'COCO', 'contributor': 'COCO',
+    'url': 'url', 'date_created': '2017-01-01'
+}
+LICENSE_DICT = {'id': 1, 'name': 'license', 'url': 'url'}
+
+
+class TestGeneratedLoaders(unittest.TestCase):
+    """Generated `_load` skips `__init__`, so it should build the same objects as the dataclass constructor."""
+
+    def assertLoadsAs(self, cls, dictionary, **converted):
+        loaded = cls._load(dictionary)
+        self.assertIs(type(loaded), cls)
+        self.assertEqual(loaded, cls(**dict(dictionary, **converted)))
+
+    def test_plain_dataclasses(self):
+        for cls, dictionary in (
+            (RLE, RLE_DICT),
+            (SegmentInfo, SEGMENT_INFO_DICT),
+            (ImageCaptioningAnnotation, CAPTION_DICT),
+            (ObjectDetectionCategory, OBJECT_DETECTION_CATEGORY_DICT),
+            (KeypointDetectionCategory, KEYPOINT_CATEGORY_DICT),
+            (PanopticSegmentationCategory, PANOPTIC_CATEGORY_DICT),
+            (Image, IMAGE_DICT),
+            (Info, INFO_DICT),
+            (License, LICENSE_DICT),
+        ):
+            with self.subTest(cls=cls.__name__):
+                self.assertLoadsAs(cls, dictionary)
+
+    def test_object_detection_annotations(self):
+        bbox = array('d', POLYGON_DICT['bbox'])
+        self.assertLoadsAs(ObjectDetectionAnnotation, POLYGON_DICT, bbox=bbox)
+        self.assertLoadsAs(ObjectDetectionPolygonAnnotation, POLYGON_DICT, bbox=bbox)
+        self.assertLoadsAs(StuffSegmentationAnnotation, POLYGON_DICT, bbox=bbox)
+        self.assertLoadsAs(KeypointDetectionAnnotation, KEYPOINT_DICT, bbox=bbox)
+
+    def test_nested_rle(self):
+        bbox = array('d', RLE_ANNOTATION_DICT['bbox'])
+        self.assertLoadsAs(ObjectDetectionRLEAnnotation, RLE_ANNOTATION_DICT, segmentation=RLE(**RLE_DICT), bbox=bbox)
+        self.assertLoadsAs(ObjectDetectionAnnotation, RLE_ANNOTATION_DICT, segmentation=RLE(**RLE_DICT), bbox=bbox)
+
+    def test_panoptic_segmentation_annotation(self):
+        segments_info = [SegmentInfo(**segment_info) for segment_info in PANOPTIC_DICT['segments_info']]
+        self.assertLoadsAs(PanopticSegmentationAnnotation, PANOPTIC_DICT, segments_info=segments_info)
+
+    def test_dense_pose_annotation(self):
+        self.assertLoadsAs(
+            DensePoseAnnotation, DENSE_POSE_DICT,
+            dp_I=array('d', DENSE_POSE_DICT['dp_I']), dp_U=array('d', DENSE_POSE_DICT['dp_U']),
+            dp_V=array('d', DENSE_POSE_DICT['dp_V']), dp_x=array('d', DENSE_POSE_DICT['dp_x']),
+            dp_y=array('d', DENSE_POSE_DICT['dp_y']), dp_masks=[RLE(**RLE_DICT)],
+        )
+
+    def test_pooled_segment_info(self):
+        released = SegmentInfo(0, 0, 0, [0, 0, 0, 0], 1)
+        SegmentInfo.release([released])
+        loaded = SegmentInfo._load(SEGMENT_INFO_DICT)
+        self.assertIs(loaded, released)
+        self.assertEqual(loaded, SegmentInfo(**SEGMENT_INFO_DICT))
+
+    def test_pooled_nested_rle(self):
+        released = RLE([0], [0, 0])
+        RLE.release([released])
+        loaded = ObjectDetectionRLEAnnotation._load(RLE_ANNOTATION_DICT)
+        self.assertIs(loaded.segmentation, released)
+        self.assertEqual(loaded.segmentation, RLE(**RLE_DICT))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+import unittest
+
+from structures.coco import COCO
+
+from tests.test_coco import coco_dict, object_detection_dict
+
+try:
+    import msgspec
+    from structures.msgspec_models import load_coco
+except ImportError:
+    msgspec = None
+
+
+@unittest.skipUnless(msgspec, 'requires msgspec')
+class TestLoadCOCO(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write_json(self, dictionary):
+        path = os.path.join(self.directory.name, 'coco.json')
+        with open(path, 'w') as json_file:
+            json.dump(dictionary, json_file)
+        return path
+
+    def test_same_as_from_json(self):
+        rle = {'counts': [2, 3, 4], 'size': [3, 3]}
+        path = self.write_json(coco_dict([
+            object_detection_dict(1, 1, 1),
+            object_detection_dict(2, 2, 2, segmentation=rle, iscrowd=1, extra='ignored'),
+        ]))
+        coco = load_coco(path)
+        self.assertEqual(coco, COCO.from_json(path))
+
+    def test_missing_keys_are_rejected(self):
+        for key, remove in (
+            ('license', lambda dictionary: dictionary['images'][0].pop('license')),
+            ('info', lambda dictionary: dictionary['info'].pop('url')),
+            ('area', lambda dictionary: dictionary['annotations'][0].pop('area')),
+            ('bbox', lambda dictionary: dictionary['annotations'][0].pop('bbox')),
+            ('categories', lambda dictionary: dictionary.pop('categories')),
+        ):
+            with self.subTest(key=key):
+                dictionary = coco_dict([object_detection_dict(1, 1, 1)])
+                remove(dictionary)
+                path = self.write_json(dictionary)
+                with self.assertRaises(ValueError):
+                    COCO.from_json(path)
+                with self.assertRaises(msgspec.ValidationError):
+                    load_coco(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
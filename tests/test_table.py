@@ -0,0 +1,103 @@
+import unittest
+
+from array import array
+
+from structures import Image
+from structures.annotation import RLE, ObjectDetectionAnnotation, SegmentInfo
+from structures.table import AnnotationTable, ImageTable, SegmentInfoArray, indices_of, stack_bboxes
+
+
+ANNOTATION_DICTS = [
+    {
+        'id': 1, 'image_id': 1, 'category_id': 2, 'segmentation': [[0.0, 0.0, 1.0, 1.0]],
+        'area': 1.5, 'bbox': [0.0, 0.5, 1.0, 1.5], 'iscrowd': 0
+    },
+    {
+        'id': 2, 'image_id': 2, 'category_id': 1, 'segmentation': {'counts': [2, 3, 4], 'size': [3, 3]},
+        'area': 3.0, 'bbox': [1.0, 0.0, 1.0, 3.0], 'iscrowd': 1
+    },
+    {
+        'id': 3, 'image_id': 1, 'category_id': 2, 'segmentation': [[1.0, 1.0, 2.0, 2.0]],
+        'area': 1.0, 'bbox': [1.0, 1.0, 1.0, 1.0], 'iscrowd': 0
+    },
+]
+SEGMENT_INFO_DICTS = [
+    {'id': id, 'category_id': category_id, 'area': 10, 'bbox': [1, 2, 3, 4], 'iscrowd': 0}
+    for id, category_id in ((1, 5), (2, 6), (3, 5))
+]
+IMAGE_DICTS = [
+    {
+        'id': id, 'width': 640, 'height': 480, 'file_name': f'{id}.jpg', 'license': license,
+        'flickr_url': 'flickr', 'coco_url': 'coco', 'date_captured': '2017-01-01'
+    } for id, license in ((1, 1), (2, 2), (3, 1))
+]
+
+
+class TestHelpers(unittest.TestCase):
+
+    def test_indices_of(self):
+        self.assertEqual(indices_of(array('q', [1, 2, 1, 3, 1]), 1), [0, 2, 4])
+        self.assertEqual(indices_of(array('q', [1, 2]), 5), [])
+
+    def test_stack_bboxes(self):
+        annotations = [ObjectDetectionAnnotation(id, 1, 1, [], 0, [id, 0, 1, 1], 0) for id in (1, 2)]
+        self.assertEqual(stack_bboxes(annotations), array('d', [1, 0, 1, 1, 2, 0, 1, 1]))
+        self.assertEqual(stack_bboxes(annotations, 'q').typecode, 'q')
+
+
+class TestAnnotationTable(unittest.TestCase):
+
+    def test_from_dicts_same_as_from_annotations(self):
+        table = AnnotationTable.from_dicts(ANNOTATION_DICTS)
+        expected = AnnotationTable.from_annotations(ObjectDetectionAnnotation.from_dicts(ANNOTATION_DICTS))
+        self.assertEqual(table, expected)
+        self.assertIsInstance(table.segmentations[1], RLE)
+
+    def test_rows(self):
+        table = AnnotationTable.from_dicts(ANNOTATION_DICTS)
+        self.assertEqual(len(table), 3)
+        self.assertEqual([annotation.to_dict() for annotation in table], ANNOTATION_DICTS)
+        self.assertEqual(table[-1].id, 3)
+        with self.assertRaises(IndexError):
+            table[3]
+
+    def test_filters(self):
+        table = AnnotationTable.from_dicts(ANNOTATION_DICTS)
+        self.assertEqual(table.filter_by_image_id(1), [0, 2])
+        self.assertEqual(table.filter_by_category_id(1), [1])
+        self.assertEqual(table.group_by_image_id(), {1: [0, 2], 2: [1]})
+
+    def test_validates_first_dictionary(self):
+        with self.assertRaises(ValueError):
+            AnnotationTable.from_dicts([{'id': 1}])
+
+
+class TestSegmentInfoArray(unittest.TestCase):
+
+    def test_from_dicts_same_as_from_segments_info(self):
+        segments_info = SegmentInfoArray.from_dicts(SEGMENT_INFO_DICTS)
+        expected = SegmentInfoArray.from_segments_info([SegmentInfo(**segment_info) for segment_info in SEGMENT_INFO_DICTS])
+        self.assertEqual(segments_info, expected)
+
+    def test_rows(self):
+        segments_info = SegmentInfoArray.from_dicts(SEGMENT_INFO_DICTS)
+        self.assertEqual(list(segments_info), [SegmentInfo(**segment_info) for segment_info in SEGMENT_INFO_DICTS])
+        self.assertEqual(segments_info.filter_by_category_id(5), [0, 2])
+
+
+class TestImageTable(unittest.TestCase):
+
+    def test_from_dicts_same_as_from_images(self):
+        table = ImageTable.from_dicts(IMAGE_DICTS)
+        self.assertEqual(table, ImageTable.from_images([Image(**image) for image in IMAGE_DICTS]))
+        self.assertEqual(list(table), [Image(**image) for image in IMAGE_DICTS])
+
+    def test_filter_select_and_trim(self):
+        table = ImageTable.from_dicts(IMAGE_DICTS)
+        self.assertEqual(table.filter_by_license(1), [0, 2])
+        self.assertEqual(list(table.select([2, 0]).ids), [3, 1])
+        self.assertEqual(list(table.trim({1, 2}, {1}).ids), [1])
+
+
+if __name__ == '__main__':
+    unittest.main()